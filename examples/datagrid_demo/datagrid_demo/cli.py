@@ -7,185 +7,649 @@ Commands::
     uv run demo download-genome  # Download full genome VCF from Zenodo (~483 MB)
 """
 
+import argparse
+import functools
+import hashlib
 import json
+import mmap
 import os
-import urllib.request
+import queue
+import sys
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import ExitStack
 from pathlib import Path
+from typing import BinaryIO
 
-import typer
-
-app = typer.Typer(
-    name="demo",
-    help="DataGrid demo app with genome viewer.",
-    invoke_without_command=True,
-)
+import httpx
 
 GENOME_URL: str = "https://zenodo.org/records/18370498/files/antonkulaga.vcf?download=1"
-DATA_DIR: Path = Path(__file__).resolve().parent / "data"
+# Resolved once at import; the Reflex app root is the parent of this package.
+APP_DIR: Path = Path(__file__).resolve().parent.parent
+DATA_DIR: Path = APP_DIR / "datagrid_demo" / "data"
 GENOME_PATH: Path = DATA_DIR / "antonkulaga.vcf"
-# JSON sidecar for HTTP caching metadata (ETag, size).
+# JSON sidecar for HTTP caching metadata (ETag, Last-Modified, size).
 GENOME_META_PATH: Path = DATA_DIR / ".antonkulaga.vcf.meta.json"
+# Parquet copy of the genome.  The VCF is sorted by position, so row-group
+# min/max statistics let filters on chrom/start skip most of the file, and
+# scroll chunks decode only the row groups they touch -- no VCF re-parsing.
+GENOME_PARQUET_PATH: Path = DATA_DIR / "antonkulaga.parquet"
+# Rows per Parquet row group: the granularity of statistics pruning.
+_GENOME_ROW_GROUP_SIZE: int = 100_000
+# Parquet key-value metadata entry holding the VCF header's column
+# descriptions as JSON, so the app need not parse the VCF header.
+GENOME_DESCRIPTIONS_KEY: str = "reflex_mui_datagrid.descriptions"
+
+# Number of concurrent HTTP Range requests used for a fresh download.
+DOWNLOAD_SEGMENTS: int = 8
+_CHUNK_SIZE: int = 1024 * 1024  # 1 MiB
+# Chunks buffered between the network reader and the disk writer thread.
+_WRITE_QUEUE_DEPTH: int = 8
+# The written prefix is dropped from the page cache in windows of this size.
+_DROP_BEHIND_BYTES: int = 32 * 1024 * 1024
+# Minimum seconds between progress repaints (caps terminal writes at 10 Hz).
+_PROGRESS_INTERVAL: float = 0.1
+
+# Parsed once; every request below reuses it.
+_GENOME_URL: httpx.URL = httpx.URL(GENOME_URL)
+
+
+@functools.lru_cache(maxsize=1)
+def _http_client() -> httpx.Client:
+    """Return the pooled HTTP client, built on first use.
+
+    One client serves the whole download, so the revalidating GET and the
+    parallel segment requests share keep-alive connections instead of
+    paying a fresh TCP + TLS handshake each.  Building it lazily keeps its
+    SSL context and pool out of ``demo run``, which makes no requests.
+    ``identity`` encoding keeps byte offsets aligned with ``Range`` /
+    ``Content-Length``.
+    """
+    return httpx.Client(
+        follow_redirects=True,
+        headers={"Accept-Encoding": "identity"},
+        timeout=httpx.Timeout(30.0, connect=15.0),
+        transport=httpx.HTTPTransport(
+            retries=3,
+            limits=httpx.Limits(
+                max_connections=DOWNLOAD_SEGMENTS + 1,
+                max_keepalive_connections=DOWNLOAD_SEGMENTS + 1,
+            ),
+        ),
+    )
 
 
 def _run_app() -> None:
     """Start the Reflex demo app."""
-    app_dir = Path(__file__).resolve().parent.parent
-    os.chdir(app_dir)
+    os.chdir(APP_DIR)
 
     from reflex.reflex import cli
 
     cli(["run"])
 
 
-@app.callback(invoke_without_command=True)
-def default(ctx: typer.Context) -> None:
-    """Run the demo app (default when no subcommand is given)."""
-    if ctx.invoked_subcommand is None:
-        _run_app()
+@functools.lru_cache(maxsize=1)
+def _load_cache_meta(mtime_ns: int) -> dict[str, str]:
+    """Parse the sidecar JSON; memoized per modification time."""
+    return json.loads(GENOME_META_PATH.read_text())
+
 
+def _read_cache_meta() -> dict[str, str]:
+    """Read cached HTTP metadata (ETag, Last-Modified, size) from the sidecar JSON."""
+    try:
+        mtime_ns = GENOME_META_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return dict(_load_cache_meta(mtime_ns))
 
-@app.command()
-def run() -> None:
-    """Run the Reflex demo app."""
-    _run_app()
 
+def _write_cache_meta(meta: dict[str, str]) -> None:
+    """Persist HTTP metadata to the sidecar JSON.
 
-def _read_cache_meta() -> dict[str, str]:
-    """Read cached HTTP metadata (ETag, Content-Length) from the sidecar JSON."""
-    if GENOME_META_PATH.exists():
-        return json.loads(GENOME_META_PATH.read_text())
+    Written to a temporary file and renamed into place, so an interrupted
+    write never leaves a truncated sidecar behind.
+    """
+    tmp = GENOME_META_PATH.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(meta, indent=2))
+    os.replace(tmp, GENOME_META_PATH)
+    _load_cache_meta.cache_clear()
+
+
+def _file_fingerprint(path: Path) -> dict[str, str]:
+    """Return size, mtime and BLAKE2b digest of *path* for the cache sidecar."""
+    stat = path.stat()
+    with path.open("rb") as f:
+        digest = hashlib.file_digest(f, "blake2b").hexdigest()
+    return {
+        "size": str(stat.st_size),
+        "mtime_ns": str(stat.st_mtime_ns),
+        "blake2b": digest,
+    }
+
+
+def _is_local_copy_intact(meta: dict[str, str]) -> bool:
+    """Check the cached genome against the fingerprint taken after download.
+
+    An unchanged size and mtime prove the file is untouched without reading
+    it.  If only the mtime moved (copy, backup restore), the file is
+    re-hashed and, on a digest match, the new mtime is recorded.
+    """
+    if "blake2b" not in meta:
+        return False
+    stat = GENOME_PATH.stat()
+    if str(stat.st_size) != meta.get("size"):
+        return False
+    if str(stat.st_mtime_ns) == meta.get("mtime_ns"):
+        return True
+    fingerprint = _file_fingerprint(GENOME_PATH)
+    if fingerprint["blake2b"] != meta["blake2b"]:
+        return False
+    _write_cache_meta({**meta, **fingerprint})
+    return True
+
+
+def _weak_etag(etag: str) -> str:
+    """Strip the ``W/`` prefix so weak and strong forms compare equal."""
+    return etag.removeprefix("W/")
+
+
+def _validators(resp: httpx.Response) -> dict[str, str]:
+    """Return the cache validators of *resp* for the sidecar JSON."""
+    return {
+        "etag": resp.headers.get("ETag", ""),
+        "last_modified": resp.headers.get("Last-Modified", ""),
+    }
+
+
+def _conditional_headers(meta: dict[str, str]) -> dict[str, str]:
+    """Build revalidation headers from cached validators.
+
+    The ETag is preferred; ``Last-Modified`` is the fallback for servers
+    that send no ETag.
+    """
+    if meta.get("etag"):
+        return {"If-None-Match": meta["etag"]}
+    if meta.get("last_modified"):
+        return {"If-Modified-Since": meta["last_modified"]}
     return {}
 
 
-def _write_cache_meta(meta: dict[str, str]) -> None:
-    """Persist HTTP metadata to the sidecar JSON."""
-    GENOME_META_PATH.write_text(json.dumps(meta, indent=2))
+class _DownloadProgress:
+    """Thread-safe byte counter that renders a single-line progress display.
+
+    Repaints are throttled to one per ``_PROGRESS_INTERVAL`` seconds and
+    written straight to the raw stdout buffer, bypassing Click's styling
+    layer.  Nothing is drawn when stdout is not a terminal, so piped or CI
+    output is not flooded with carriage-return frames.
+    """
+
+    def __init__(self, total_size: int, downloaded: int = 0) -> None:
+        self.total_size = total_size
+        self.downloaded = downloaded
+        self._lock = threading.Lock()
+        self._last_paint = 0.0
+        # Replaced streams (pytest capture, io.StringIO, some IDE consoles)
+        # may lack ``.buffer``; progress is simply not drawn on them.
+        buffer = getattr(sys.stdout, "buffer", None)
+        self._enabled = False
+        if buffer is not None and sys.stdout.isatty():
+            self._enabled = True
+            self._write = buffer.write
+            self._flush = buffer.flush
+        # Scale factors are fixed per download; repaints only multiply.
+        self._inv_mb = 1.0 / (1024 * 1024)
+        self._inv_pct = 100.0 / total_size if total_size > 0 else 0.0
+        self._mb_total = total_size * self._inv_mb
+
+    def advance(self, nbytes: int) -> None:
+        """Record *nbytes* more bytes and repaint the line if it is due."""
+        with self._lock:
+            self.downloaded += nbytes
+            if not self._enabled:
+                return
+            now = time.monotonic()
+            if now - self._last_paint >= _PROGRESS_INTERVAL:
+                self._last_paint = now
+                self._paint()
+
+    def finish(self) -> None:
+        """Paint the final totals and end the progress line."""
+        if not self._enabled:
+            return
+        with self._lock:
+            self._paint()
+            self._write(b"\n")
+            self._flush()
+
+    def _paint(self) -> None:
+        mb_done = self.downloaded * self._inv_mb
+        if self._inv_pct:
+            pct = min(100.0, self.downloaded * self._inv_pct)
+            line = b"\r  %.1f / %.1f MB (%.1f%%)" % (mb_done, self._mb_total, pct)
+        else:
+            line = b"\r  %.1f MB downloaded" % mb_done
+        self._write(line)
+        self._flush()
 
 
-def _is_cache_fresh() -> bool:
-    """Check if the cached genome file is still fresh using a HEAD request + ETag.
+def _total_size(resp: httpx.Response, existing_bytes: int = 0) -> int:
+    """Return the full file size implied by *resp*, or ``-1`` if unknown.
 
-    Returns True if the file exists and the server's ETag matches the
-    cached one (or if the server is unreachable — assume cache is valid).
+    A ``206`` reports the size after the slash of ``Content-Range``; a
+    ``200`` carries the whole body in ``Content-Length``.
     """
-    if not GENOME_PATH.exists():
-        return False
+    if resp.status_code == 206:
+        _, _, total = resp.headers.get("Content-Range", "").rpartition("/")
+        if total.isdigit():
+            return int(total)
+    content_length = resp.headers.get("Content-Length")
+    if content_length:
+        return int(content_length) + (existing_bytes if resp.status_code == 206 else 0)
+    return -1
 
-    meta = _read_cache_meta()
-    cached_etag = meta.get("etag")
-    if not cached_etag:
-        # No ETag stored — trust the file if it has non-zero size.
-        return GENOME_PATH.stat().st_size > 0
 
-    req = urllib.request.Request(GENOME_URL, method="HEAD")
-    resp = urllib.request.urlopen(req, timeout=15)
-    server_etag = resp.headers.get("ETag", "")
-    return server_etag == cached_etag
+class _SegmentCancelled(Exception):
+    """Raised in a segment download once another segment has failed."""
 
 
-def _download_with_resume(dest: Path, part: Path) -> None:
-    """Download the genome VCF, resuming a partial download if possible.
+def _write_range(
+    mm: mmap.mmap,
+    resp: httpx.Response,
+    start: int,
+    end: int,
+    progress: _DownloadProgress,
+    cancel: threading.Event,
+) -> None:
+    """Stream *resp* into *mm* at ``start..end`` (inclusive), then stop.
 
-    Uses ``Range`` header so that a previously interrupted download can
-    pick up where it left off instead of re-downloading from scratch.
-    Stores ETag in a sidecar JSON for future freshness checks.
+    Gives up before the next chunk once *cancel* is set.
+    """
+    offset = start
+    for chunk in resp.iter_bytes(_CHUNK_SIZE):
+        if cancel.is_set():
+            raise _SegmentCancelled(f"Segment bytes={start}-{end} cancelled")
+        n = min(len(chunk), end + 1 - offset)
+        mm[offset : offset + n] = memoryview(chunk)[:n]
+        offset += n
+        progress.advance(n)
+        if offset > end:
+            break
+    if offset != end + 1:
+        raise ConnectionError(
+            f"Segment bytes={start}-{end} ended early at offset {offset}"
+        )
+
+
+def _fetch_segment(
+    mm: mmap.mmap,
+    start: int,
+    end: int,
+    progress: _DownloadProgress,
+    cancel: threading.Event,
+) -> None:
+    """Download bytes ``start..end`` (inclusive) and write them at their offset.
+
+    A failure sets *cancel*, so the other segments stop early.
     """
-    existing_bytes = part.stat().st_size if part.exists() else 0
+    headers = {"Range": f"bytes={start}-{end}"}
+    try:
+        with _http_client().stream("GET", _GENOME_URL, headers=headers) as resp:
+            if resp.status_code != 206:
+                raise ConnectionError(
+                    f"Server ignored range request bytes={start}-{end} "
+                    f"(HTTP {resp.status_code})"
+                )
+            _write_range(mm, resp, start, end, progress, cancel)
+    except BaseException:
+        cancel.set()
+        raise
+
+
+def _download_parallel(
+    dest: Path,
+    part: Path,
+    resp: httpx.Response,
+    total_size: int,
+    segments: int = DOWNLOAD_SEGMENTS,
+) -> None:
+    """Download the genome VCF as *segments* concurrent HTTP Range segments.
+
+    *resp* is the already-open ``206`` response for ``bytes=0-``; it
+    supplies the first segment while the remaining ones are fetched by
+    worker threads.  The *part* file is pre-allocated to *total_size*
+    and memory-mapped; every segment is copied into the mapping at its
+    offset, with no write syscall per chunk.  Segments finish
+    out of order, so an interrupted parallel download cannot be resumed
+    and the partial file is removed.  On an error or Ctrl-C the other
+    segments are cancelled at their next chunk rather than run to the end.
+    """
+    progress = _DownloadProgress(total_size)
+    cancel = threading.Event()
+    bounds = [
+        (i * total_size // segments, (i + 1) * total_size // segments - 1)
+        for i in range(segments)
+    ]
+    try:
+        with part.open("w+b") as f:
+            f.truncate(total_size)
+            with mmap.mmap(f.fileno(), total_size) as mm:
+                pool = ThreadPoolExecutor(max_workers=segments - 1 or 1)
+                try:
+                    futures = [
+                        pool.submit(_fetch_segment, mm, start, end, progress, cancel)
+                        for start, end in bounds[1:]
+                        if start <= end
+                    ]
+                    first_start, first_end = bounds[0]
+                    try:
+                        if first_start <= first_end:
+                            _write_range(
+                                mm, resp, first_start, first_end, progress, cancel
+                            )
+                    except _SegmentCancelled:
+                        pass  # a worker failed; its error is raised below
+                    wait(futures)
+                    for future in futures:
+                        error = future.exception()
+                        if error is not None and not isinstance(
+                            error, _SegmentCancelled
+                        ):
+                            raise error
+                except BaseException:
+                    cancel.set()
+                    raise
+                finally:
+                    # Workers stop within a chunk once cancelled; wait for
+                    # them so none writes into the mapping after it closes.
+                    pool.shutdown(wait=True, cancel_futures=True)
+                mm.flush()
+    except BaseException:
+        part.unlink(missing_ok=True)
+        raise
+
+    progress.finish()
+
+    part.rename(dest)
+    _write_cache_meta({**_validators(resp), **_file_fingerprint(dest)})
 
-    headers: dict[str, str] = {}
-    if existing_bytes > 0:
-        headers["Range"] = f"bytes={existing_bytes}-"
-        typer.echo(f"  Resuming from {existing_bytes / (1024 * 1024):.1f} MB")
 
-    req = urllib.request.Request(GENOME_URL, headers=headers)
-    resp = urllib.request.urlopen(req, timeout=30)
+def _write_behind(
+    f: BinaryIO, chunks: Iterable[bytes], progress: _DownloadProgress
+) -> None:
+    """Write *chunks* to *f* from a background thread.
 
+    The calling thread keeps receiving from the socket while the previous
+    chunk is being written, so network and disk I/O overlap instead of
+    alternating.  The bounded queue caps buffered memory at
+    ``_WRITE_QUEUE_DEPTH * _CHUNK_SIZE``.
+
+    Where ``posix_fadvise`` exists the file is marked sequential, and every
+    ``_DROP_BEHIND_BYTES`` the window before the one just completed is
+    released from the page cache.  The genome is never re-read through
+    the cache, so it should not push other data out.
+    """
+    pending: queue.Queue[bytes | None] = queue.Queue(maxsize=_WRITE_QUEUE_DEPTH)
+    errors: list[BaseException] = []
+    fadvise = getattr(os, "posix_fadvise", None)
+    fd = f.fileno()
+    if fadvise is not None:
+        fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+    def _writer() -> None:
+        written = f.tell()
+        dropped = 0
+        while (chunk := pending.get()) is not None:
+            if errors:
+                continue  # keep draining so the reader never blocks
+            try:
+                f.write(chunk)
+                written += len(chunk)
+                if fadvise is not None and written - dropped >= 2 * _DROP_BEHIND_BYTES:
+                    # Lag one window behind so its pages have had time to be
+                    # written back; DONTNEED skips pages that are still dirty.
+                    f.flush()
+                    fadvise(fd, dropped, _DROP_BEHIND_BYTES, os.POSIX_FADV_DONTNEED)
+                    dropped += _DROP_BEHIND_BYTES
+            except BaseException as exc:
+                errors.append(exc)
+
+    thread = threading.Thread(target=_writer, name="genome-writer", daemon=True)
+    thread.start()
+    try:
+        for chunk in chunks:
+            if errors:
+                break
+            pending.put(chunk)
+            progress.advance(len(chunk))
+    finally:
+        pending.put(None)
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def _download_with_resume(
+    dest: Path, part: Path, resp: httpx.Response, existing_bytes: int
+) -> None:
+    """Stream *resp* into *part*, appending to a partial download if possible.
+
+    *resp* answers a ``Range: bytes=<existing_bytes>-`` request, so a
+    previously interrupted download picks up where it left off instead of
+    re-downloading from scratch.  Stores validators in a sidecar JSON for
+    future freshness checks.
+    """
     # If server doesn't support Range (200 instead of 206), start fresh.
-    if resp.status == 200 and existing_bytes > 0:
-        typer.echo("  Server does not support resume — downloading from scratch.")
+    if resp.status_code == 200 and existing_bytes > 0:
+        print("  Server does not support resume — downloading from scratch.")
         existing_bytes = 0
 
-    content_length = resp.headers.get("Content-Length")
-    total_size = int(content_length) + existing_bytes if content_length else -1
+    total_size = _total_size(resp, existing_bytes)
 
-    mode = "ab" if (existing_bytes > 0 and resp.status == 206) else "wb"
+    mode = "ab" if (existing_bytes > 0 and resp.status_code == 206) else "wb"
     if mode == "wb":
         existing_bytes = 0  # reset counter for progress display
 
-    chunk_size = 1024 * 256  # 256 KB
-    downloaded = existing_bytes
+    progress = _DownloadProgress(total_size, existing_bytes)
 
     with part.open(mode) as f:
-        while True:
-            chunk = resp.read(chunk_size)
-            if not chunk:
-                break
-            f.write(chunk)
-            downloaded += len(chunk)
-            if total_size > 0:
-                pct = min(100.0, downloaded * 100.0 / total_size)
-                mb_done = downloaded / (1024 * 1024)
-                mb_total = total_size / (1024 * 1024)
-                typer.echo(
-                    f"\r  {mb_done:.1f} / {mb_total:.1f} MB ({pct:.1f}%)", nl=False
-                )
-            else:
-                mb_done = downloaded / (1024 * 1024)
-                typer.echo(f"\r  {mb_done:.1f} MB downloaded", nl=False)
+        _write_behind(f, resp.iter_bytes(_CHUNK_SIZE), progress)
 
-    typer.echo()  # newline after progress
+    progress.finish()
 
     part.rename(dest)
 
     # Persist ETag for future cache checks.
-    etag = resp.headers.get("ETag", "")
-    _write_cache_meta({"etag": etag, "size": str(dest.stat().st_size)})
+    _write_cache_meta({**_validators(resp), **_file_fingerprint(dest)})
+
+
+def _confirm(prompt: str, default: bool = False) -> bool:
+    """Ask a yes/no question on the terminal."""
+    suffix = " [Y/n]: " if default else " [y/N]: "
+    answer = input(prompt + suffix).strip().lower()
+    if not answer:
+        return default
+    return answer in ("y", "yes")
+
 
+def convert_genome_to_parquet() -> None:
+    """Write the Parquet copy of the genome VCF unless it is up to date.
 
-@app.command()
-def download_genome() -> None:
+    The copy is considered current when it is newer than the VCF, so a
+    re-downloaded VCF is converted again.
+    """
+    if (
+        GENOME_PARQUET_PATH.exists()
+        and GENOME_PARQUET_PATH.stat().st_mtime_ns >= GENOME_PATH.stat().st_mtime_ns
+    ):
+        return
+
+    # Deferred: polars-bio is only needed for this one-off conversion.
+    import polars_bio as pb
+
+    from reflex_mui_datagrid import extract_vcf_descriptions
+
+    print("Converting genome VCF to Parquet for fast filtering and scrolling...")
+    tmp_path = GENOME_PARQUET_PATH.with_suffix(".parquet.tmp")
+    lf = pb.scan_vcf(str(GENOME_PATH))
+    lf.sink_parquet(
+        tmp_path,
+        statistics=True,
+        row_group_size=_GENOME_ROW_GROUP_SIZE,
+        metadata={GENOME_DESCRIPTIONS_KEY: json.dumps(extract_vcf_descriptions(lf))},
+    )
+    os.replace(tmp_path, GENOME_PARQUET_PATH)
+    size_mb = GENOME_PARQUET_PATH.stat().st_size / (1024 * 1024)
+    print(f"  Wrote {GENOME_PARQUET_PATH} ({size_mb:.1f} MB)")
+
+
+def download_genome(check_remote: bool = False) -> None:
     """Download the full human genome VCF from Zenodo (~483 MB).
 
     Source: https://zenodo.org/records/18370498
     The file is saved to the demo's data/ directory.
 
     Features:
-    - Caches the file on disk and checks the server ETag before re-downloading.
+    - Caches the file on disk with a size/mtime/BLAKE2b fingerprint; an
+      intact copy is accepted without any network request.
+    - With ``--check-remote``, revalidates it with a single conditional
+      GET (``If-None-Match``, or ``If-Modified-Since`` without an ETag)
+      instead of a separate HEAD request.
+    - Fetches fresh downloads as parallel HTTP Range segments.
     - Supports resuming interrupted downloads via HTTP Range requests.
+    - Converts the VCF once to Parquet (with row-group statistics) for the app.
     """
+    try:
+        _fetch_genome(check_remote)
+    finally:
+        if _http_client.cache_info().currsize:
+            _http_client().close()
+            _http_client.cache_clear()
     if GENOME_PATH.exists():
-        size_mb = GENOME_PATH.stat().st_size / (1024 * 1024)
-        typer.echo(f"Genome file already exists: {GENOME_PATH} ({size_mb:.1f} MB)")
+        convert_genome_to_parquet()
+        print("Run the demo with: uv run demo")
 
-        # Check freshness via ETag.
-        typer.echo("  Checking if remote file has changed...")
-        if _is_cache_fresh():
-            typer.echo("  File is up to date (ETag matches). Nothing to download.")
-            raise typer.Exit()
+
+def _fetch_genome(check_remote: bool) -> None:
+    """Bring ``GENOME_PATH`` up to date; see :func:`download_genome`."""
+    headers: dict[str, str] = {}
+    if GENOME_PATH.exists():
+        size_mb = GENOME_PATH.stat().st_size / (1024 * 1024)
+        print(f"Genome file already exists: {GENOME_PATH} ({size_mb:.1f} MB)")
+
+        meta = _read_cache_meta()
+        intact = _is_local_copy_intact(meta)
+        if intact and not check_remote:
+            # Zenodo record files are immutable; an intact copy is current.
+            print("  Local copy matches its fingerprint. Nothing to download.")
+            return
+        if not intact and "blake2b" in meta:
+            # Send no validators, forcing a full body instead of a 304.
+            print("  Local copy does not match its fingerprint.")
         else:
-            typer.echo("  Remote file may have changed.")
-            overwrite = typer.confirm("Download again?", default=False)
-            if not overwrite:
-                raise typer.Exit()
+            headers.update(_conditional_headers(meta))
+            if not headers and GENOME_PATH.stat().st_size > 0:
+                # No validators stored — trust the file if it has non-zero size.
+                print("  No ETag or Last-Modified cached. Nothing to download.")
+                return
+        print("  Checking if remote file has changed...")
 
     DATA_DIR.mkdir(parents=True, exist_ok=True)
+    # Sequential downloads append to ``.part`` and can be resumed.  Parallel
+    # ones pre-allocate ``.parts`` to the full size and fill it out of order,
+    # so a leftover from a killed run has holes and is never resumed.
     part_path = GENOME_PATH.with_suffix(".vcf.part")
-
-    typer.echo("Downloading genome VCF from Zenodo...")
-    typer.echo(f"  URL:  {GENOME_URL}")
-    typer.echo(f"  Dest: {GENOME_PATH}")
-    typer.echo()
-
-    _download_with_resume(GENOME_PATH, part_path)
+    parts_path = GENOME_PATH.with_suffix(".vcf.parts")
+    parts_path.unlink(missing_ok=True)
+    existing_bytes = part_path.stat().st_size if part_path.exists() else 0
+
+    # One request both revalidates the cache and starts the transfer: a 304
+    # means the file is current, otherwise the body is streamed right away.
+    revalidating = bool(headers)
+    cached_etag = headers.get("If-None-Match", "")
+    headers["Range"] = f"bytes={existing_bytes}-"
+    client = _http_client()
+    with ExitStack() as stack:
+        resp = stack.enter_context(client.stream("GET", _GENOME_URL, headers=headers))
+        if resp.status_code == 416 and existing_bytes > 0:
+            # The .part already spans the whole file (killed before the
+            # rename); it cannot be resumed, so start over.
+            stack.close()
+            print("  Partial download cannot be resumed — restarting.")
+            part_path.unlink()
+            existing_bytes = 0
+            headers["Range"] = "bytes=0-"
+            resp = stack.enter_context(
+                client.stream("GET", _GENOME_URL, headers=headers)
+            )
+        # Weak comparison also covers servers that ignore the condition but
+        # return the same entity tag, possibly with a W/ prefix.
+        if resp.status_code == 304 or (
+            cached_etag
+            and _weak_etag(resp.headers.get("ETag", "")) == _weak_etag(cached_etag)
+        ):
+            print("  File is up to date (not modified on server). Nothing to download.")
+            return
+        resp.raise_for_status()
+
+        if GENOME_PATH.exists():
+            if revalidating:
+                print("  Remote file may have changed.")
+            overwrite = _confirm("Download again?", default=False)
+            if not overwrite:
+                return
+
+        print("Downloading genome VCF from Zenodo...")
+        print(f"  URL:  {GENOME_URL}")
+        print(f"  Dest: {GENOME_PATH}")
+        print()
+
+        # A fresh download is split into concurrent Range requests when the
+        # server honours them; an existing .part file is resumed sequentially.
+        total_size = _total_size(resp)
+        if (
+            resp.status_code == 206
+            and existing_bytes == 0
+            and total_size > 0
+        ):
+            print(f"  Fetching in {DOWNLOAD_SEGMENTS} parallel segments")
+            _download_parallel(GENOME_PATH, parts_path, resp, total_size)
+        else:
+            if existing_bytes > 0:
+                print(f"  Resuming from {existing_bytes / (1024 * 1024):.1f} MB")
+            _download_with_resume(GENOME_PATH, part_path, resp, existing_bytes)
 
     size_mb = GENOME_PATH.stat().st_size / (1024 * 1024)
-    typer.echo(f"Download complete: {size_mb:.1f} MB")
-    typer.echo("Run the demo with: uv run demo")
+    print(f"Download complete: {size_mb:.1f} MB")
 
 
-def main() -> None:
-    """Entry point for the CLI."""
-    app()
+def main(argv: list[str] | None = None) -> None:
+    """Entry point for the CLI.
+
+    Plain ``argparse`` keeps ``uv run demo download-genome`` free of the
+    typer/click/rich import tree; with no subcommand the app is started.
+    """
+    parser = argparse.ArgumentParser(
+        prog="demo", description="DataGrid demo app with genome viewer."
+    )
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    commands.add_parser("run", help="Run the Reflex demo app.")
+    download = commands.add_parser(
+        "download-genome",
+        help="Download the full human genome VCF from Zenodo (~483 MB).",
+    )
+    download.add_argument(
+        "--check-remote",
+        action="store_true",
+        help="Revalidate with the server even if the local copy is intact.",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "download-genome":
+        download_genome(check_remote=args.check_remote)
+    else:
+        _run_app()
 
 
 if __name__ == "__main__":
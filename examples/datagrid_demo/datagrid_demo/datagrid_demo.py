@@ -6,44 +6,58 @@ Six tabs:
      with ``column_overrides`` demonstrating URL cell rendering
      (PGS Catalog links with ``suffixUrl``) and custom column widths.
   3. Employee Data -- small client-side scrollable grid (no pagination).
-  4. Genomic Variants (VCF) -- small client-side VCF grid with
-     auto-extracted column descriptions.
-  5. Longevity Map (Parquet) -- **server-side** lazy grid loaded from
-     HuggingFace via ``hf://``.  Uses ``LazyFrameGridMixin`` for
+  4. Genomic Variants (VCF) -- small VCF scroll-loaded server-side via
+     ``LazyFrameGridMixin``, with auto-extracted column descriptions.
+  5. Longevity Map (Parquet) -- **server-side** lazy grid over a
+     HuggingFace parquet, fetched once via ``hf://`` into a local copy
+     (``PARQUET_CACHE_PATH``).  Uses ``LazyFrameGridMixin`` for
      server-side filtering, sorting, and scroll-loading.
   6. Full Genome (Server-Side) -- ~4.5 M row whole-genome VCF with
      server-side scroll-loading via a second ``LazyFrameGridMixin``.
 
-Tabs 2, 5, and 6 each use their own ``LazyFrameGridMixin`` substate so
+Tabs 2, 4, 5, and 6 each use their own ``LazyFrameGridMixin`` substate so
 they get independent ``lf_grid_*`` state vars and caches.
 """
 
+import asyncio
+import functools
+import json
+import os
+import threading
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, TypedDict
 
 import polars as pl
-import polars_bio as pb
 import reflex as rx
 
 from reflex_mui_datagrid import (
+    ColumnDef,
     LazyFrameGridMixin,
-    bio_lazyframe_to_datagrid,
     data_grid,
-    extract_vcf_descriptions,
     lazyframe_grid,
     lazyframe_grid_detail_box,
     lazyframe_grid_stats_bar,
     lazyframe_to_datagrid,
+    lazyframe_to_datagrid_columnar,
     scan_file,
 )
 
 VCF_PATH: Path = Path(__file__).parent / "data" / "antku_small.vcf"
-
-# Pre-compute VCF column descriptions at module level so both
-# the data loader and the row-click handler can use them.
-_vcf_lf_for_meta: pl.LazyFrame = pb.scan_vcf(str(VCF_PATH))
-VCF_DESCRIPTIONS: dict[str, str] = extract_vcf_descriptions(_vcf_lf_for_meta)
-del _vcf_lf_for_meta  # don't hold onto the LazyFrame
+# Fixed VCF columns shown in the grid; the remaining INFO/FORMAT fields are
+# only fetched for the clicked row.
+VCF_GRID_COLUMNS: list[str] = [
+    "chrom",
+    "start",
+    "end",
+    "id",
+    "ref",
+    "alt",
+    "qual",
+    "filter",
+]
+# Repeats a handful of values (PASS, RefCall, LowQual).
+VCF_CATEGORICAL_COLUMNS: list[str] = ["filter"]
 
 
 # ---------------------------------------------------------------------------
@@ -52,6 +66,56 @@ del _vcf_lf_for_meta  # don't hold onto the LazyFrame
 
 GENOME_URL: str = "https://zenodo.org/records/18370498/files/antonkulaga.vcf?download=1"
 GENOME_PATH: Path = Path(__file__).parent / "data" / "antonkulaga.vcf"
+# Written by ``uv run demo download-genome`` (``cli.convert_genome_to_parquet``).
+GENOME_PARQUET_PATH: Path = GENOME_PATH.with_suffix(".parquet")
+# Metadata entry with the VCF column descriptions (``cli.GENOME_DESCRIPTIONS_KEY``).
+GENOME_DESCRIPTIONS_KEY: str = "reflex_mui_datagrid.descriptions"
+
+# Seconds a genome-presence check is reused across page loads.
+_GENOME_CHECK_TTL: float = 5.0
+_genome_check: tuple[float, bool] = (float("-inf"), False)
+
+
+def _genome_available() -> bool:
+    """Return whether ``GENOME_PATH`` exists, re-checking at most every few seconds."""
+    global _genome_check
+    checked_at, exists = _genome_check
+    now = time.monotonic()
+    if now - checked_at > _GENOME_CHECK_TTL:
+        exists = GENOME_PATH.exists()
+        _genome_check = (now, exists)
+    return exists
+
+
+def _mtime_ns(path: Path) -> int:
+    """Return *path*'s modification time, or 0 if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_genome(
+    vcf_mtime_ns: int, parquet_mtime_ns: int
+) -> tuple[pl.LazyFrame, dict[str, str]]:
+    """Scan the genome once per file version; shared by every session.
+
+    Prefers the Parquet copy when it is at least as new as the VCF: its
+    row-group statistics let filters skip most of the file, and chunk
+    requests decode only the row groups they slice instead of re-parsing
+    VCF text.  The conversion stores the VCF header's column descriptions
+    in the Parquet metadata, so the VCF is not opened at all; copies
+    written without them fall back to reading the header.
+    """
+    if parquet_mtime_ns >= vcf_mtime_ns:
+        metadata = pl.read_parquet_metadata(GENOME_PARQUET_PATH)
+        lf = pl.scan_parquet(GENOME_PARQUET_PATH, parallel="prefiltered")
+        if GENOME_DESCRIPTIONS_KEY in metadata:
+            return lf, json.loads(metadata[GENOME_DESCRIPTIONS_KEY])
+        return lf, scan_file(GENOME_PATH)[1]
+    return scan_file(GENOME_PATH)
+
 
 # ---------------------------------------------------------------------------
 # Parquet (HuggingFace) constants
@@ -60,6 +124,31 @@ GENOME_PATH: Path = Path(__file__).parent / "data" / "antonkulaga.vcf"
 PARQUET_HF_URL: str = (
     "hf://datasets/just-dna-seq/annotators/data/longevitymap/weights.parquet"
 )
+# Local copy of the dataset, fetched on the first load. Delete it to refresh.
+PARQUET_CACHE_PATH: Path = (
+    Path(__file__).parent / "data" / "longevitymap_weights.parquet"
+)
+# Serializes the first download when several sessions open the tab at once.
+_PARQUET_FETCH_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_longevity_map() -> pl.LazyFrame:
+    """Return the Longevity Map LazyFrame, shared by every session.
+
+    The parquet is streamed from HuggingFace to ``PARQUET_CACHE_PATH``
+    once, so later loads -- and every chunk request the grid makes --
+    read the local file instead of going back over the network.
+    """
+    with _PARQUET_FETCH_LOCK:
+        if not PARQUET_CACHE_PATH.exists():
+            PARQUET_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = PARQUET_CACHE_PATH.with_suffix(".parquet.tmp")
+            pl.scan_parquet(PARQUET_HF_URL).sink_parquet(tmp_path)
+            os.replace(tmp_path, PARQUET_CACHE_PATH)
+    # Filters decode their predicate columns first and only materialize the
+    # remaining columns for matching rows.
+    return pl.scan_parquet(PARQUET_CACHE_PATH, parallel="prefiltered")
 
 
 # ---------------------------------------------------------------------------
@@ -187,6 +276,16 @@ def _build_prs_lazyframe() -> pl.LazyFrame:
     return pl.LazyFrame(data)
 
 
+class EmployeeRow(TypedDict):
+    """The employee fields the row-click handler reads."""
+
+    id: int
+    first_name: str
+    last_name: str
+    department: str
+    salary: int
+
+
 def _build_employee_lazyframe() -> pl.LazyFrame:
     """Create a sample LazyFrame with employee data."""
     return pl.LazyFrame(
@@ -302,7 +401,105 @@ def _build_employee_lazyframe() -> pl.LazyFrame:
                 False,
                 True,
             ],
-        }
+        },
+        # Three departments: stored as small integer codes, shown as a dropdown.
+        schema_overrides={"department": pl.Categorical},
+    )
+
+
+def _style_prs_columns(col_defs: list[ColumnDef]) -> list[ColumnDef]:
+    """Drop detail-only PRS fields and attach cell renderers to the rest."""
+    # Fields shown only in the expandable detail panel, not as grid columns.
+    detail_only_fields = {
+        "risk_hint", "interpretation", "estimated_percentile",
+        "reference_source", "Population",
+    }
+
+    population_colors: dict[str, tuple[str, str]] = {
+        "AFR": ("#f57f17", "#fff9c4"),
+        "AMR": ("#d81b60", "#f8bbd0"),
+        "EAS": ("#388e3c", "#c8e6c9"),
+        "EUR": ("#1976d2", "#bbdefb"),
+        "SAS": ("#8e24aa", "#e1bee7"),
+    }
+
+    visible_col_defs: list[ColumnDef] = []
+    for col in col_defs:
+        if col.field in detail_only_fields:
+            continue
+        if col.field == "Percentile":
+            col.cell_renderer_type = "progress_bar"
+            col.cell_renderer_config = {
+                "color": "#1976d2",
+                "trackColor": "#e0e0e0",
+                "showValue": True,
+            }
+        elif col.field in population_colors:
+            c, bg = population_colors[col.field]
+            col.cell_renderer_type = "badge"
+            col.cell_renderer_config = {"color": c, "bgColor": bg}
+        elif col.field == "Pct. Method":
+            col.cell_renderer_type = "badge"
+            col.cell_renderer_config = {"color": "#1976d2", "bgColor": "#e3f2fd"}
+        elif col.field == "Quality":
+            col.cell_renderer_type = "badge"
+            col.cell_renderer_config = {
+                "colorMap": {
+                    "High": "#2e7d32",
+                    "Moderate": "#f57f17",
+                    "Low": "#c62828",
+                },
+                "bgColorMap": {
+                    "High": "#e8f5e9",
+                    "Moderate": "#fff3e0",
+                    "Low": "#ffebee",
+                },
+            }
+        elif col.field == "Match Rate":
+            col.cell_renderer_type = "progress_bar"
+            col.cell_renderer_config = {
+                "color": "#43a047",
+                "trackColor": "#e8e8e8",
+                "showValue": True,
+            }
+        visible_col_defs.append(col)
+
+    return visible_col_defs
+
+
+# The PRS sample is seeded and static: convert and style it once at import so
+# each page load only assigns the cached rows and serialized column defs.
+PRS_ROWS, _prs_col_defs = lazyframe_to_datagrid(_build_prs_lazyframe())
+PRS_COLUMNS: list[dict[str, Any]] = [
+    c.dict() for c in _style_prs_columns(_prs_col_defs)
+]
+del _prs_col_defs
+
+
+# Same for the employee sample.
+EMPLOYEE_DATA, _employee_col_defs = lazyframe_to_datagrid_columnar(
+    _build_employee_lazyframe()
+)
+EMPLOYEE_COLUMNS: list[dict[str, Any]] = [c.dict() for c in _employee_col_defs]
+del _employee_col_defs
+
+
+@functools.cache
+def _scan_small_vcf() -> tuple[pl.LazyFrame, dict[str, str]]:
+    """Scan the small VCF on first use; ``VCF_PATH`` is fixed.
+
+    ``scan_file`` imports polars-bio only here, so starting the app and
+    serving the other tabs never pays for it.  The header descriptions
+    are parsed once and shared by every session.  Low-cardinality columns
+    are cast to ``Categorical`` so their filters and distinct-value scans
+    work on integer codes.
+    """
+    lf, descriptions = scan_file(VCF_PATH)
+    return (
+        lf.with_columns(
+            pl.col(c).cast(pl.Categorical) for c in VCF_CATEGORICAL_COLUMNS
+        ),
+        descriptions,
     )
 
 
@@ -352,6 +549,28 @@ class PrsLazyState(LazyFrameGridMixin, rx.State):
         self.prs_lazy_loaded = True  # type: ignore[assignment]
 
 
+class VcfState(LazyFrameGridMixin, rx.State):
+    """Server-side lazy grid for the small VCF sample.
+
+    Rows are scroll-loaded in chunks rather than sent to the browser as
+    one state payload, so the tab scales to larger VCFs.
+    """
+
+    async def load_vcf(self):
+        """Scan the VCF and prepare for lazy browsing, once per session.
+
+        The first scan imports polars-bio and parses the header; it runs
+        in a worker thread so other sessions' events are not held up.
+        """
+        if self.lf_grid_loaded:
+            return
+        lf, descriptions = await asyncio.to_thread(_scan_small_vcf)
+        for _ in self.set_lazyframe(
+            lf, descriptions, chunk_size=500, grid_columns=VCF_GRID_COLUMNS
+        ):
+            yield
+
+
 class ParquetState(LazyFrameGridMixin, rx.State):
     """Server-side lazy grid for the Longevity Map parquet dataset.
 
@@ -363,13 +582,17 @@ class ParquetState(LazyFrameGridMixin, rx.State):
     pq_loaded: bool = False
     pq_loading_init: bool = False
 
-    def load_parquet(self):
-        """Scan the parquet from HuggingFace and prepare for lazy browsing."""
+    async def load_parquet(self):
+        """Scan the (cached) HuggingFace parquet and prepare for lazy browsing.
+
+        The first call downloads the dataset; that runs in a worker thread
+        so the event loop keeps serving other sessions meanwhile.
+        """
         self.pq_loading_init = True  # type: ignore[assignment]
         yield
 
-        lf = pl.scan_parquet(PARQUET_HF_URL)
-        yield from self.set_lazyframe(
+        lf = await asyncio.to_thread(_scan_longevity_map)
+        for _ in self.set_lazyframe(
             lf,
             column_overrides={
                 "rsid": {
@@ -381,7 +604,8 @@ class ParquetState(LazyFrameGridMixin, rx.State):
                     },
                 },
             },
-        )
+        ):
+            yield
         self.pq_loaded = True  # type: ignore[assignment]
         self.pq_loading_init = False  # type: ignore[assignment]
 
@@ -397,7 +621,7 @@ class GenomeState(LazyFrameGridMixin, rx.State):
 
     def check_genome(self) -> None:
         """Check if the genome file exists on disk."""
-        self.genome_available = GENOME_PATH.exists()
+        self.genome_available = _genome_available()
 
     def load_genome(self):
         """Scan the genome VCF and prepare for lazy browsing."""
@@ -407,7 +631,9 @@ class GenomeState(LazyFrameGridMixin, rx.State):
             )
             return
 
-        lf, descriptions = scan_file(GENOME_PATH)
+        lf, descriptions = _scan_genome(
+            _mtime_ns(GENOME_PATH), _mtime_ns(GENOME_PARQUET_PATH)
+        )
         yield from self.set_lazyframe(lf, descriptions)
 
 
@@ -416,115 +642,45 @@ class GenomeState(LazyFrameGridMixin, rx.State):
 # ---------------------------------------------------------------------------
 
 
+DEFAULT_TAB: str = "prs"
+# Tabs whose data is loaded on first visit -> loader event.
+# PRS and employee data are class defaults on AppState instead.
+_TAB_LOADERS: dict[str, rx.EventHandler] = {
+    "vcf": VcfState.load_vcf,
+}
+
+
 class AppState(rx.State):
     """Application state holding data for the small client-side tabs.
 
-    The Parquet and Genome tabs use their own ``LazyFrameGridMixin``
-    substates (``ParquetState`` and ``GenomeState``).
+    The VCF, Parquet and Genome tabs use their own ``LazyFrameGridMixin``
+    substates (``VcfState``, ``ParquetState`` and ``GenomeState``).
+
+    The PRS and employee samples are static, so they are bound as class
+    defaults: they are compiled into the page's initial state and a new
+    session needs no event round-trip to show them.
     """
 
     # PRS tab
-    prs_rows: list[dict[str, Any]] = []
-    prs_columns: list[dict[str, Any]] = []
+    prs_rows: list[dict[str, Any]] = PRS_ROWS
+    prs_columns: list[dict[str, Any]] = PRS_COLUMNS
     prs_selected: str = "Click a row to see its details."
-    prs_row_count: int = 0
+    prs_row_count: int = len(PRS_ROWS)
 
     # Employee tab
-    emp_rows: list[dict[str, Any]] = []
-    emp_columns: list[dict[str, Any]] = []
+    # Column-oriented ({field: [values...]}) -- see lazyframe_to_datagrid_columnar.
+    emp_data: dict[str, Any] = EMPLOYEE_DATA
+    emp_columns: list[dict[str, Any]] = EMPLOYEE_COLUMNS
     emp_selected: str = "Click a row to see its details."
-
-    # VCF tab
-    vcf_rows: list[dict[str, Any]] = []
-    vcf_columns: list[dict[str, Any]] = []
-    vcf_selected: str = "Click a variant to see its details."
-    vcf_row_count: int = 0
+    _emp_last_row_id: int = -1
 
     # ------------------------------------------------------------------
     # Initialisation
     # ------------------------------------------------------------------
 
-    def load_all(self) -> None:
-        """Load the small client-side datasets on page load."""
-        self._load_employees()
-        self._load_vcf()
-        self._load_prs()
-
-    def _load_prs(self) -> None:
-        lf = _build_prs_lazyframe()
-        rows, col_defs = lazyframe_to_datagrid(lf)
-
-        # Fields shown only in the expandable detail panel, not as grid columns.
-        detail_only_fields = {
-            "risk_hint", "interpretation", "estimated_percentile",
-            "reference_source", "Population",
-        }
-
-        population_colors: dict[str, tuple[str, str]] = {
-            "AFR": ("#f57f17", "#fff9c4"),
-            "AMR": ("#d81b60", "#f8bbd0"),
-            "EAS": ("#388e3c", "#c8e6c9"),
-            "EUR": ("#1976d2", "#bbdefb"),
-            "SAS": ("#8e24aa", "#e1bee7"),
-        }
-
-        visible_col_defs = []
-        for col in col_defs:
-            if col.field in detail_only_fields:
-                continue
-            if col.field == "Percentile":
-                col.cell_renderer_type = "progress_bar"
-                col.cell_renderer_config = {
-                    "color": "#1976d2",
-                    "trackColor": "#e0e0e0",
-                    "showValue": True,
-                }
-            elif col.field in population_colors:
-                c, bg = population_colors[col.field]
-                col.cell_renderer_type = "badge"
-                col.cell_renderer_config = {"color": c, "bgColor": bg}
-            elif col.field == "Pct. Method":
-                col.cell_renderer_type = "badge"
-                col.cell_renderer_config = {"color": "#1976d2", "bgColor": "#e3f2fd"}
-            elif col.field == "Quality":
-                col.cell_renderer_type = "badge"
-                col.cell_renderer_config = {
-                    "colorMap": {
-                        "High": "#2e7d32",
-                        "Moderate": "#f57f17",
-                        "Low": "#c62828",
-                    },
-                    "bgColorMap": {
-                        "High": "#e8f5e9",
-                        "Moderate": "#fff3e0",
-                        "Low": "#ffebee",
-                    },
-                }
-            elif col.field == "Match Rate":
-                col.cell_renderer_type = "progress_bar"
-                col.cell_renderer_config = {
-                    "color": "#43a047",
-                    "trackColor": "#e8e8e8",
-                    "showValue": True,
-                }
-            visible_col_defs.append(col)
-
-        self.prs_rows = rows
-        self.prs_columns = [c.dict() for c in visible_col_defs]
-        self.prs_row_count = len(rows)
-
-    def _load_employees(self) -> None:
-        lf = _build_employee_lazyframe()
-        rows, col_defs = lazyframe_to_datagrid(lf)
-        self.emp_rows = rows
-        self.emp_columns = [c.dict() for c in col_defs]
-
-    def _load_vcf(self) -> None:
-        lf = pb.scan_vcf(str(VCF_PATH))
-        rows, col_defs = bio_lazyframe_to_datagrid(lf)
-        self.vcf_rows = rows
-        self.vcf_columns = [c.dict() for c in col_defs]
-        self.vcf_row_count = len(rows)
+    def load_tab(self, tab: str) -> rx.EventHandler | None:
+        """Trigger a tab's loader when the user opens it."""
+        return _TAB_LOADERS.get(tab)
 
     # ------------------------------------------------------------------
     # Employee handlers
@@ -545,37 +701,17 @@ class AppState(rx.State):
 
     def handle_emp_row_click(self, params: dict[str, Any]) -> None:
         """Handle employee row click."""
-        row = params.get("row", {})
+        row: EmployeeRow | None = params.get("row")
         if row:
-            name = f"{row.get('first_name', '')} {row.get('last_name', '')}"
-            dept = row.get("department", "N/A")
-            salary = row.get("salary", "N/A")
+            # Re-clicking the selected row would only resend the same text.
+            if row["id"] == self._emp_last_row_id:
+                return
+            self._emp_last_row_id = row["id"]
             self.emp_selected = (
-                f"Selected: {name} | Department: {dept} | Salary: ${salary:,}"
-                if isinstance(salary, (int, float))
-                else f"Selected: {name} | Department: {dept} | Salary: {salary}"
+                f"Selected: {row['first_name']} {row['last_name']} | "
+                f"Department: {row['department']} | Salary: ${row['salary']:,}"
             )
 
-    # ------------------------------------------------------------------
-    # Small VCF handlers
-    # ------------------------------------------------------------------
-
-    def handle_vcf_row_click(self, params: dict[str, Any]) -> None:
-        """Handle VCF variant row click -- show all fields with descriptions."""
-        row: dict[str, Any] = params.get("row", {})
-        if not row:
-            return
-
-        lines: list[str] = []
-        for field, value in row.items():
-            if field == "__row_id__":
-                continue
-            desc = VCF_DESCRIPTIONS.get(field, "")
-            if desc:
-                lines.append(f"{field}: {value}  ({desc})")
-            else:
-                lines.append(f"{field}: {value}")
-        self.vcf_selected = "\n".join(lines)
 
 
 # ---------------------------------------------------------------------------
@@ -712,9 +848,9 @@ def employee_tab() -> rx.Component:
             color="var(--gray-11)",
         ),
         rx.cond(
-            AppState.emp_rows.length() > 0,  # type: ignore[operator]
+            AppState.emp_columns.length() > 0,  # type: ignore[operator]
             data_grid(
-                rows=AppState.emp_rows,
+                column_data=AppState.emp_data,
                 columns=AppState.emp_columns,
                 row_id_field="id",
                 pagination=False,
@@ -735,54 +871,33 @@ def employee_tab() -> rx.Component:
 
 
 def vcf_tab() -> rx.Component:
-    """Genomic variants (VCF) tab content."""
+    """Genomic variants (VCF) tab -- server-side via VcfState."""
     return rx.box(
         rx.text(
             "Genomic variant calls loaded from a VCF file via ",
             rx.code("polars_bio.scan_vcf()"),
             " as a native polars LazyFrame, with column descriptions "
             "auto-extracted via ",
-            rx.code("bio_lazyframe_to_datagrid()"),
-            ". Hover over a column header to see its description. "
-            "No pagination -- all rows are scrollable (MUI's built-in row "
-            "virtualisation only renders visible DOM rows). "
-            "Client-side filtering (MUI Community: single filter at a time).",
+            rx.code("extract_vcf_descriptions()"),
+            ". Rows are scroll-loaded in chunks of 500 via ",
+            rx.code("LazyFrameGridMixin"),
+            " instead of being sent to the browser all at once. "
+            "Only the fixed VCF columns are shown; click a row to see all of "
+            "its INFO and FORMAT fields, looked up on the backend. "
+            "Hover over a column header to see its description. "
+            "Filtering and sorting run on the backend.",
             margin_bottom="1em",
             color="var(--gray-11)",
         ),
         rx.cond(
-            AppState.vcf_rows.length() > 0,  # type: ignore[operator]
+            VcfState.lf_grid_loaded,
             rx.fragment(
-                rx.text(
-                    AppState.vcf_row_count.to(str),  # type: ignore[union-attr]
-                    " variants loaded",
-                    size="2",
-                    color="var(--gray-9)",
-                    margin_bottom="0.5em",
-                ),
-                data_grid(
-                    rows=AppState.vcf_rows,
-                    columns=AppState.vcf_columns,
-                    row_id_field="__row_id__",
-                    pagination=False,
-                    hide_footer=True,
-                    show_toolbar=True,
-                    show_description_in_header=True,
-                    density="compact",
-                    column_header_height=70,
-                    on_row_click=AppState.handle_vcf_row_click,
-                    height="540px",
-                    width="100%",
-                ),
-            ),
-        ),
-        _status_box(
-            rx.text(
-                AppState.vcf_selected,
-                white_space="pre-wrap",
-                size="2",
+                lazyframe_grid_stats_bar(VcfState),
+                lazyframe_grid(VcfState, height="540px"),
             ),
+            rx.text("Loading variants...", size="2", color="var(--gray-9)"),
         ),
+        lazyframe_grid_detail_box(VcfState),
         padding_top="1em",
     )
 
@@ -796,9 +911,9 @@ def parquet_tab() -> rx.Component:
                 "HuggingFace parquet file",
                 href="https://huggingface.co/datasets/just-dna-seq/annotators/blob/main/data/longevitymap/weights.parquet",
             ),
-            " via polars' native ",
+            ", fetched once via polars' native ",
             rx.code("hf://"),
-            " protocol -- no fsspec or manual download needed. ",
+            " protocol into a local copy that later loads scan instead. ",
             rx.text("Server-side", weight="bold", as_="span"),
             " filtering, sorting, and scroll-loading via ",
             rx.code("LazyFrameGridMixin"),
@@ -822,9 +937,10 @@ def parquet_tab() -> rx.Component:
                     size="3",
                 ),
                 rx.text(
-                    "Click to fetch the longevity-map weights parquet (~26 KB) "
-                    "directly from HuggingFace using polars' native hf:// protocol. "
-                    "Data is scanned lazily -- only page slices are collected.",
+                    "Click to load the longevity-map weights parquet (~26 KB). "
+                    "The first load downloads it from HuggingFace via polars' "
+                    "native hf:// protocol and keeps a local copy; the grid "
+                    "scans that copy lazily -- only page slices are collected.",
                     size="2",
                     color="var(--gray-9)",
                     margin_top="0.5em",
@@ -930,7 +1046,8 @@ def index() -> rx.Component:
             rx.tabs.content(vcf_tab(), value="vcf"),
             rx.tabs.content(parquet_tab(), value="parquet"),
             rx.tabs.content(genome_tab(), value="genome"),
-            default_value="prs",
+            default_value=DEFAULT_TAB,
+            on_change=AppState.load_tab,
         ),
         padding="2em",
         max_width="1400px",
@@ -939,7 +1056,4 @@ def index() -> rx.Component:
 
 
 app = rx.App()
-app.add_page(
-    index,
-    on_load=[AppState.load_all, GenomeState.check_genome],
-)
+app.add_page(index, on_load=GenomeState.check_genome)
@@ -10,41 +10,130 @@ VCF/BAM column descriptions from file headers)::
     pip install reflex-mui-datagrid[bio]
 """
 
-from reflex_mui_datagrid.datagrid import (
-    DataGrid,
-    DataGridNamespace,
-    WrappedDataGrid,
-    data_grid,
-)
-from reflex_mui_datagrid.lazyframe_grid import (
-    LazyFrameGridMixin,
-    lazyframe_grid,
-    lazyframe_grid_detail_box,
-    lazyframe_grid_filter_debug,
-    lazyframe_grid_stats_bar,
-    merge_filter_model,
-    scan_file,
-)
-from reflex_mui_datagrid.models import (
-    ColumnDef,
-    UrlCellRenderer,
-    BadgeCellRenderer,
-    ProgressBarCellRenderer,
-)
-from reflex_mui_datagrid.polars_utils import (
-    apply_filter_model,
-    apply_sort_model,
-    build_column_defs_from_schema,
-    lazyframe_to_datagrid,
-    polars_dtype_to_grid_type,
-    show_dataframe,
-)
+import importlib
+import importlib.util
+import sys
+import types
+from typing import TYPE_CHECKING, Any
 
-# Optional polars-bio integration – available when installed with [bio] extra.
-try:
+if TYPE_CHECKING:
+    from reflex_mui_datagrid.datagrid import (
+        DataGrid,
+        DataGridNamespace,
+        WrappedDataGrid,
+        data_grid,
+    )
+    from reflex_mui_datagrid.lazyframe_grid import (
+        LazyFrameGridMixin,
+        lazyframe_grid,
+        lazyframe_grid_detail_box,
+        lazyframe_grid_filter_debug,
+        lazyframe_grid_stats_bar,
+        merge_filter_model,
+        scan_file,
+    )
+    from reflex_mui_datagrid.models import (
+        ColumnDef,
+        UrlCellRenderer,
+        BadgeCellRenderer,
+        ProgressBarCellRenderer,
+    )
     from reflex_mui_datagrid.polars_bio_utils import (
         bio_lazyframe_to_datagrid,
+        bio_lazyframe_to_datagrid_columnar,
         extract_vcf_descriptions,
     )
-except ImportError:
-    pass
+    from reflex_mui_datagrid.polars_utils import (
+        apply_filter_model,
+        apply_sort_model,
+        build_column_defs_from_schema,
+        lazyframe_to_datagrid,
+        lazyframe_to_datagrid_columnar,
+        polars_dtype_to_grid_type,
+        show_dataframe,
+    )
+
+# Public name -> defining submodule.  Submodules (and with them reflex and
+# polars) are imported on first attribute access, so entry points such as
+# the CLI's ``--help`` do not pay for them.
+_EXPORTS: dict[str, str] = {
+    "DataGrid": "datagrid",
+    "DataGridNamespace": "datagrid",
+    "WrappedDataGrid": "datagrid",
+    "data_grid": "datagrid",
+    "LazyFrameGridMixin": "lazyframe_grid",
+    "lazyframe_grid": "lazyframe_grid",
+    "lazyframe_grid_detail_box": "lazyframe_grid",
+    "lazyframe_grid_filter_debug": "lazyframe_grid",
+    "lazyframe_grid_stats_bar": "lazyframe_grid",
+    "merge_filter_model": "lazyframe_grid",
+    "scan_file": "lazyframe_grid",
+    "ColumnDef": "models",
+    "UrlCellRenderer": "models",
+    "BadgeCellRenderer": "models",
+    "ProgressBarCellRenderer": "models",
+    "apply_filter_model": "polars_utils",
+    "apply_sort_model": "polars_utils",
+    "build_column_defs_from_schema": "polars_utils",
+    "lazyframe_to_datagrid": "polars_utils",
+    "lazyframe_to_datagrid_columnar": "polars_utils",
+    "polars_dtype_to_grid_type": "polars_utils",
+    "show_dataframe": "polars_utils",
+}
+
+# Optional polars-bio integration – available when installed with [bio] extra.
+_BIO_EXPORTS = frozenset(
+    {
+        "bio_lazyframe_to_datagrid",
+        "bio_lazyframe_to_datagrid_columnar",
+        "extract_vcf_descriptions",
+    }
+)
+
+
+# Derived from the registries above so ``from reflex_mui_datagrid import *``
+# still exports the public API now that nothing is imported eagerly.  The
+# polars-bio names are only listed when the [bio] extra is installed;
+# otherwise the star-import would fail on them.
+__all__ = [
+    *_EXPORTS,
+    *(_BIO_EXPORTS if importlib.util.find_spec("polars_bio") else ()),
+]
+
+
+class _Package(types.ModuleType):
+    """Package module that keeps exports named like their submodule.
+
+    Importing a submodule binds it on the package, which would otherwise
+    replace e.g. the ``lazyframe_grid`` function with its module.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if _EXPORTS.get(name) == name and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        module = importlib.import_module(f"{__name__}.{_EXPORTS[name]}")
+        value = getattr(module, name)
+        globals()[name] = value  # later lookups skip __getattr__
+        return value
+    if name in _BIO_EXPORTS:
+        try:
+            from reflex_mui_datagrid import polars_bio_utils
+        except ImportError as e:
+            # Keep ``hasattr()`` checks working when the extra is missing.
+            raise AttributeError(
+                f"{name!r} requires polars-bio: pip install reflex-mui-datagrid[bio]"
+            ) from e
+        return getattr(polars_bio_utils, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS, *_BIO_EXPORTS])
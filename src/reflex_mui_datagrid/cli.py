@@ -16,9 +16,8 @@ scroll-loading, filtering, and sorting.
 """
 
 import os
-import subprocess
+import string
 import sys
-import tempfile
 from pathlib import Path
 from typing import Annotated, Optional
 
@@ -31,44 +30,60 @@ app = typer.Typer(
 )
 
 
+_FORMAT_MAP: dict[str, str] = {
+    ".vcf": "vcf",
+    ".vcf.gz": "vcf",
+    ".bcf": "vcf",
+    ".csv": "csv",
+    ".tsv": "tsv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".json": "json",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".ipc": "ipc",
+    ".arrow": "ipc",
+    ".feather": "ipc",
+    ".bam": "bam",
+    ".gff": "gff",
+    ".gff3": "gff",
+    ".gtf": "gff",
+    ".bed": "bed",
+    ".fasta": "fasta",
+    ".fa": "fasta",
+    ".fastq": "fastq",
+    ".fq": "fastq",
+}
+
+
 def _detect_format(path: Path) -> str:
     """Detect file format from extension."""
-    suffix = path.suffix.lower()
-    format_map: dict[str, str] = {
-        ".vcf": "vcf",
-        ".vcf.gz": "vcf",
-        ".bcf": "vcf",
-        ".csv": "csv",
-        ".tsv": "tsv",
-        ".parquet": "parquet",
-        ".pq": "parquet",
-        ".json": "json",
-        ".ndjson": "ndjson",
-        ".jsonl": "ndjson",
-        ".ipc": "ipc",
-        ".arrow": "ipc",
-        ".feather": "ipc",
-        ".bam": "bam",
-        ".gff": "gff",
-        ".gff3": "gff",
-        ".gtf": "gff",
-        ".bed": "bed",
-        ".fasta": "fasta",
-        ".fa": "fasta",
-        ".fastq": "fastq",
-        ".fq": "fastq",
-    }
     # Check two-part extensions first (e.g. .vcf.gz)
-    double_suffix = (
-        "".join(path.suffixes[-2:]).lower() if len(path.suffixes) >= 2 else ""
-    )
-    if double_suffix in format_map:
-        return format_map[double_suffix]
-    return format_map.get(suffix, "csv")
+    parts = path.name.lower().rsplit(".", 2)
+    if len(parts) == 3:
+        double_suffix = f".{parts[1]}.{parts[2]}"
+        if double_suffix in _FORMAT_MAP:
+            return _FORMAT_MAP[double_suffix]
+    return _FORMAT_MAP.get(path.suffix.lower(), "csv")
 
 
 _BIO_FORMATS: set[str] = {"vcf", "bam", "gff", "bed", "fasta", "fastq"}
 
+# Generated viewer apps are kept here, one directory per distinct app, so a
+# relaunch reuses the ``.web/`` tree (and its node_modules) from last time.
+_CACHE_DIR: Path = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "reflex-mui-datagrid"
+)
+# CSV/TSV files larger than this are viewed through a cached Parquet copy.
+_PARQUET_CONVERT_MIN_BYTES: int = 100 * 1024 * 1024
+_PARQUET_ROW_GROUP_SIZE: int = 100_000
+# Written into a viewer's ``.web/`` once ``reflex init`` succeeded; holds the
+# package version that built it.
+_INIT_MARKER: str = ".web/.viewer_initialized"
+# Cached viewer directories kept, counting the one being launched.
+_VIEWER_DIRS_KEPT: int = 8
+
 
 def _build_app_code(
     file_path: Path,
@@ -82,27 +97,30 @@ def _build_app_code(
     Uses ``scan_file`` + ``LazyFrameGridMixin`` + ``lazyframe_grid`` for
     server-side scroll-loading of all file formats.
     """
-    abs_path = str(file_path.resolve())
-    # Escape backslashes and quotes for embedding in Python string literal
-    safe_path = abs_path.replace("\\", "\\\\").replace('"', '\\"')
-
-    limit_kwarg = f", chunk_size={limit}" if limit else ""
-
-    # Use placeholder substitution to avoid escaping nightmares.
-    template = _APP_TEMPLATE
-    template = template.replace("__FILENAME__", file_path.name)
-    template = template.replace("__SAFE_PATH__", safe_path)
-    template = template.replace("__LIMIT_KWARG__", limit_kwarg)
-    template = template.replace("__TITLE__", title)
-    template = template.replace("__HEIGHT__", height)
-    return template
+    # repr() yields properly escaped Python string literals (quotes,
+    # backslashes, newlines) for values embedded in the generated code.
+    path_literal = repr(str(file_path.resolve()))
+
+    # The row cap is a lazy head(), so polars pushes it into the scan and
+    # reads only the first ``limit`` rows instead of the whole file.
+    limit_expr = f".head({limit})" if limit else ""
+
+    # Single-pass placeholder substitution avoids escaping nightmares, and
+    # values are never rescanned for other placeholders.
+    return _APP_TEMPLATE.substitute(
+        docstring_literal=repr(f"Auto-generated viewer app for: {file_path.name}"),
+        path_literal=path_literal,
+        limit_expr=limit_expr,
+        title_literal=repr(title),
+        height_literal=repr(height),
+    )
 
 
 # ---------------------------------------------------------------------------
-# App template -- uses __PLACEHOLDER__ tokens for dynamic parts.
+# App template -- uses ``string.Template`` $placeholders for dynamic parts.
 # ---------------------------------------------------------------------------
 
-_APP_TEMPLATE = '''"""Auto-generated viewer app for: __FILENAME__"""
+_APP_TEMPLATE = string.Template('''$docstring_literal
 
 from pathlib import Path
 from typing import Any
@@ -122,18 +140,18 @@ class ViewerState(LazyFrameGridMixin):
     """Viewer state using LazyFrameGridMixin for server-side browsing."""
 
     def load_data(self):
-        lf, descriptions = scan_file(Path("__SAFE_PATH__"))
-        yield from self.set_lazyframe(lf, descriptions__LIMIT_KWARG__)
+        lf, descriptions = scan_file(Path($path_literal))
+        yield from self.set_lazyframe(lf$limit_expr, descriptions)
 
 
 def index() -> rx.Component:
     return rx.box(
-        rx.heading("__TITLE__", size="6", margin_bottom="0.5em"),
+        rx.heading($title_literal, size="6", margin_bottom="0.5em"),
         rx.cond(
             ViewerState.lf_grid_loaded,
             rx.fragment(
                 lazyframe_grid_stats_bar(ViewerState),
-                lazyframe_grid(ViewerState, height="__HEIGHT__"),
+                lazyframe_grid(ViewerState, height=$height_literal),
             ),
             rx.text("Loading...", color="var(--gray-9)"),
         ),
@@ -146,7 +164,178 @@ def index() -> rx.Component:
 
 app = rx.App()
 app.add_page(index, on_load=ViewerState.load_data)
-'''
+''')
+
+
+def _package_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("reflex-mui-datagrid")
+    except PackageNotFoundError:  # running from a source checkout
+        return "unknown"
+
+
+def _print_version(value: bool) -> None:
+    if value:
+        typer.echo(_package_version())
+        raise typer.Exit()
+
+
+def _parquet_copy_path(file: Path) -> Path:
+    """Return where the cached Parquet copy of CSV/TSV *file* lives.
+
+    The copy lives under the cache directory, keyed by the file's path
+    only, so converting an edited file replaces its previous copy instead
+    of adding another.  Later views read Parquet -- column pruning and
+    row-group skipping -- instead of re-parsing the text on every scroll
+    chunk and filter.
+    """
+    import hashlib
+
+    digest = hashlib.blake2b(str(file).encode(), digest_size=6).hexdigest()
+    return _CACHE_DIR / "parquet" / f"{file.stem}_{digest}.parquet"
+
+
+def _source_stamp(file: Path) -> str:
+    """Return the size/mtime stamp a Parquet copy of *file* is checked against."""
+    stat = file.stat()
+    return f"{stat.st_size}|{stat.st_mtime_ns}"
+
+
+def _stamp_matches(stamp_path: Path, file: Path) -> bool:
+    """Return whether *stamp_path* records the current state of *file*."""
+    try:
+        return stamp_path.read_text() == _source_stamp(file)
+    except FileNotFoundError:
+        return False
+
+
+def _parquet_copy_is_current(file: Path, cached: Path) -> bool:
+    """Return whether *cached* was converted from the current *file*."""
+    return cached.exists() and _stamp_matches(cached.with_suffix(".stamp"), file)
+
+
+def _parquet_conversion_failed(file: Path, cached: Path) -> bool:
+    """Return whether polars already failed to convert the current *file*."""
+    return _stamp_matches(cached.with_suffix(".failed"), file)
+
+
+def _convert_to_parquet(file: Path, fmt: str, cached: Path) -> bool:
+    """Write the Parquet copy of CSV/TSV *file* to *cached*, atomically.
+
+    The schema is inferred from the whole file, as a column whose type
+    changes deep into it would otherwise abort the conversion.  The source
+    stamp is written last, so an interrupted conversion is redone on the
+    next launch.  Returns ``False`` if polars cannot convert the file; a
+    ``.failed`` stamp then stops later launches from trying again until
+    the file changes.
+    """
+    import polars as pl
+
+    cached.parent.mkdir(parents=True, exist_ok=True)
+    stamp_path = cached.with_suffix(".stamp")
+    failed_path = cached.with_suffix(".failed")
+    stamp_path.unlink(missing_ok=True)
+    failed_path.unlink(missing_ok=True)
+    stamp = _source_stamp(file)
+    tmp_path = cached.with_suffix(".parquet.tmp")
+    separator = "\t" if fmt == "tsv" else ","
+    try:
+        pl.scan_csv(
+            file, separator=separator, infer_schema_length=None
+        ).sink_parquet(tmp_path, row_group_size=_PARQUET_ROW_GROUP_SIZE)
+    except pl.exceptions.PolarsError:
+        tmp_path.unlink(missing_ok=True)
+        failed_path.write_text(stamp)
+        return False
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, cached)
+    stamp_path.write_text(stamp)
+    return True
+
+
+def _write_if_changed(path: Path, text: str) -> None:
+    """Write *text* to *path* unless it already holds exactly that.
+
+    Leaving an unchanged file alone keeps its mtime, so Python reuses the
+    bytecode cached in ``__pycache__`` instead of recompiling the module.
+    """
+    try:
+        if path.read_text() == text:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_text(text)
+
+
+def _initialized_viewers(cache_dir: Path) -> list[tuple[Path, str]]:
+    """Return ``(app_dir, package_version)`` for initialised viewers.
+
+    Sorted most recently launched first (the marker is touched on launch).
+    """
+    markers = sorted(
+        cache_dir.glob(f"viewer_*/{_INIT_MARKER}"),
+        key=lambda marker: marker.stat().st_mtime,
+        reverse=True,
+    )
+    return [(marker.parent.parent, marker.read_text().strip()) for marker in markers]
+
+
+def _seed_node_modules(app_dir: Path) -> None:
+    """Hard-link ``.web/node_modules`` from another cached viewer, if any.
+
+    Every viewer app depends on the same frontend packages, so a new app
+    directory can start from an existing install.  ``reflex init`` then
+    only has to reconcile it instead of downloading everything again.
+    Hard links make the copy near-instant and take no extra disk space.
+    A viewer built by the same package version is preferred as the donor,
+    since another version may pin different frontend packages.
+    """
+    import shutil
+
+    target = app_dir / ".web" / "node_modules"
+    if target.exists():
+        return
+    version = _package_version()
+    donors = [
+        viewer_dir / ".web" / "node_modules"
+        for viewer_dir, _ in sorted(
+            _initialized_viewers(app_dir.parent),
+            key=lambda viewer: viewer[1] != version,  # stable: keeps newest first
+        )
+        if viewer_dir != app_dir
+    ]
+    for source in donors:
+        if not source.is_dir():
+            continue
+        try:
+            shutil.copytree(source, target, symlinks=True, copy_function=os.link)
+        except OSError:
+            # e.g. cache spread across filesystems -- let reflex install.
+            shutil.rmtree(target, ignore_errors=True)
+        return
+
+
+def _evict_stale_viewers(app_dir: Path) -> None:
+    """Remove cached viewer directories that are unlikely to be reused.
+
+    Viewers built by another package version are dropped, as are all but
+    the ``_VIEWER_DIRS_KEPT`` most recently launched ones.
+    """
+    import shutil
+
+    version = _package_version()
+    others = [
+        (viewer_dir, viewer_version)
+        for viewer_dir, viewer_version in _initialized_viewers(app_dir.parent)
+        if viewer_dir != app_dir
+    ]
+    for rank, (viewer_dir, viewer_version) in enumerate(others, start=1):
+        if viewer_version != version or rank >= _VIEWER_DIRS_KEPT:
+            shutil.rmtree(viewer_dir, ignore_errors=True)
 
 
 @app.command()
@@ -170,6 +359,16 @@ def view(
     title: Annotated[
         Optional[str], typer.Option("--title", "-t", help="Page title")
     ] = None,
+    version: Annotated[
+        bool,
+        typer.Option(
+            "--version",
+            "-V",
+            callback=_print_version,
+            is_eager=True,
+            help="Show the version and exit",
+        ),
+    ] = False,
 ) -> None:
     """View a data file in an interactive browser grid.
 
@@ -177,7 +376,14 @@ def view(
     Genomic formats (VCF, BAM, GFF, BED, FASTA, FASTQ) require the [bio] extra.
 
     All formats use server-side scroll-loading with filtering and sorting.
+    CSV/TSV files over 100 MB are browsed through a Parquet copy that is
+    converted once and cached, unless ``--limit`` is given.
     """
+    # Deferred so that ``--help`` only pays for typer.
+    import hashlib
+    import subprocess
+    from concurrent.futures import Future, ThreadPoolExecutor
+
     file = file.resolve()
     if not file.exists():
         typer.echo(f"Error: file not found: {file}", err=True)
@@ -199,34 +405,74 @@ def view(
     if title is None:
         title = f"{file.name} -- DataGrid Viewer"
 
-    app_code = _build_app_code(file, fmt, limit, height, title)
+    # The Parquet copy's path is known up front, so the app code can point
+    # at it while the conversion itself overlaps with ``reflex init`` below.
+    # With ``--limit`` the lazy head() already reads only the first rows of
+    # the text file, so converting all of it would be wasted work.
+    source = file
+    conversion: Future[bool] | None = None
+    if (
+        limit is None
+        and fmt in ("csv", "tsv")
+        and file.stat().st_size > _PARQUET_CONVERT_MIN_BYTES
+        and not _parquet_conversion_failed(file, _parquet_copy_path(file))
+    ):
+        file = _parquet_copy_path(source)
+        if not _parquet_copy_is_current(source, file):
+            typer.echo(f"Converting {source.name} to Parquet for faster browsing...")
+            executor = ThreadPoolExecutor(max_workers=1)
+            conversion = executor.submit(_convert_to_parquet, source, fmt, file)
+            executor.shutdown(wait=False)
 
-    # Create a temporary Reflex app directory.
-    tmp_dir = Path(tempfile.mkdtemp(prefix="datagrid_viewer_"))
+    app_code = _build_app_code(file, fmt, limit, height, title)
     app_name = "viewer_app"
-    app_pkg = tmp_dir / app_name
-    app_pkg.mkdir()
-    (app_pkg / "__init__.py").write_text("")
-    (app_pkg / f"{app_name}.py").write_text(app_code)
-
     rxconfig_code = f"""import reflex as rx
 config = rx.Config(app_name="{app_name}", frontend_port={port})
 """
-    (tmp_dir / "rxconfig.py").write_text(rxconfig_code)
 
-    typer.echo(f"Launching viewer for: {file}")
+    # Reuse the app directory from an earlier launch with the same code.
+    # The package version is part of the key so an upgrade (which may ship
+    # different frontend assets) starts from a fresh ``reflex init``.
+    digest = hashlib.blake2b(
+        (_package_version() + app_code + rxconfig_code).encode(), digest_size=6
+    ).hexdigest()
+    app_dir = _CACHE_DIR / f"viewer_{digest}"
+    app_pkg = app_dir / app_name
+    app_pkg.mkdir(parents=True, exist_ok=True)
+    _write_if_changed(app_pkg / "__init__.py", "")
+    _write_if_changed(app_pkg / f"{app_name}.py", app_code)
+    _write_if_changed(app_dir / "rxconfig.py", rxconfig_code)
+
+    typer.echo(f"Launching viewer for: {source}")
     typer.echo(f"Format: {fmt} | Limit: {limit or 'all'} | Port: {port}")
 
-    os.chdir(tmp_dir)
+    os.chdir(app_dir)
 
     # Step 1: initialise the Reflex project (creates .web/ with node_modules).
     # We use subprocess because reflex's CLI calls sys.exit() on completion.
-    typer.echo("Initializing Reflex project...")
-    subprocess.run(
-        [sys.executable, "-m", "reflex", "init"],
-        cwd=str(tmp_dir),
-        check=True,
-    )
+    # Skipped when a previous launch of this app already did it.
+    init_marker = app_dir / _INIT_MARKER
+    if not init_marker.exists():
+        _seed_node_modules(app_dir)
+        typer.echo("Initializing Reflex project...")
+        subprocess.run(
+            [sys.executable, "-m", "reflex", "init"],
+            cwd=str(app_dir),
+            check=True,
+        )
+        init_marker.write_text(_package_version())
+        _evict_stale_viewers(app_dir)
+    else:
+        init_marker.touch()  # records the launch for eviction
+
+    # ``result()`` re-raises unexpected errors (e.g. a full disk).  When
+    # polars could not convert the file, browse the text file directly.
+    if conversion is not None and not conversion.result():
+        typer.echo(f"Could not convert {source.name} to Parquet; reading it as is.")
+        _write_if_changed(
+            app_pkg / f"{app_name}.py",
+            _build_app_code(source, fmt, limit, height, title),
+        )
 
     # Step 2: run the app via exec (replaces this process).
     typer.echo("Starting viewer...")
@@ -235,6 +481,10 @@ config = rx.Config(app_name="{app_name}", frontend_port={port})
 
 def main() -> None:
     """Entry point for the CLI."""
+    # Answer version queries without building the typer command.
+    if len(sys.argv) == 2 and sys.argv[1] in ("-V", "--version"):
+        print(_package_version())
+        return
     app()
 
 
@@ -423,6 +423,8 @@ function _buildGridProps(props, unlimitedMode) {
   const {
     showDescriptionInHeader,
     columns,
+    columnData,
+    column_data,
     pagination,
     onRowsScrollEnd,
     scrollEndThreshold,
@@ -818,15 +820,50 @@ function _DetailPanelsSlot(props) {
 }
 
 // ---------------------------------------------------------------------------
-// 7b. UnlimitedDataGrid wrapper component
+// 7c. Columnar transport: rebuild row objects from { field: [values...] }.
+//     Column names travel once per payload instead of once per row; the
+//     rows are rebuilt here only when the payload object changes.
+//     Dictionary-encoded columns ({ values, codes }) are decoded first.
 // ---------------------------------------------------------------------------
-const UnlimitedDataGrid = React.forwardRef((props, ref) => {
+function _decodeColumn(column) {
+  if (Array.isArray(column)) return column;
+  const { values, codes } = column;
+  return codes.map((code) => (code == null ? null : values[code]));
+}
+
+function _rowsFromColumnData(columnData) {
+  if (!columnData || typeof columnData !== "object") return null;
+  const fields = Object.keys(columnData);
+  if (fields.length === 0) return [];
+  const columns = fields.map((f) => _decodeColumn(columnData[f]));
+  const n = columns[0].length;
+  const rows = new Array(n);
+  for (let i = 0; i < n; i++) {
+    const row = {};
+    for (let c = 0; c < fields.length; c++) row[fields[c]] = columns[c][i];
+    rows[i] = row;
+  }
+  return rows;
+}
+
+// ---------------------------------------------------------------------------
+// 7d. UnlimitedDataGrid wrapper component
+// ---------------------------------------------------------------------------
+const UnlimitedDataGrid = React.forwardRef((rawProps, ref) => {
+  const columnData = rawProps.columnData || rawProps.column_data;
+  const columnarRows = React.useMemo(
+    () => _rowsFromColumnData(columnData), [columnData]
+  );
+  const props = columnarRows ? { ...rawProps, rows: columnarRows } : rawProps;
   const { onRowsScrollEnd, scrollEndThreshold, debugLog } = props;
   const log = !!debugLog;
   const containerRef = React.useRef(null);
   const scrollEndLockedRef = React.useRef(false);
   const renderCountRef = React.useRef(0);
   const rowsLength = Array.isArray(props.rows) ? props.rows.length : 0;
+  // Read by the scroll listener, which is not re-attached on row changes.
+  const rowsLengthRef = React.useRef(rowsLength);
+  rowsLengthRef.current = rowsLength;
 
   // Row detail panel: track which rows are expanded.
   const [expandedRowIds, setExpandedRowIds] = React.useState(() => new Set());
@@ -876,6 +913,8 @@ const UnlimitedDataGrid = React.forwardRef((props, ref) => {
             scrollHeight: scroller.scrollHeight,
             clientHeight: scroller.clientHeight,
             remaining: remaining,
+            // Lets the server drop requests made before the last chunk landed.
+            loadedRows: rowsLengthRef.current,
           };
           _dgLog(log, "scroll-end fired", payload);
           onRowsScrollEnd(payload);
@@ -1174,6 +1213,11 @@ class DataGrid(rx.Component):
     # ---- data ----
     rows: rx.Var[list[dict[str, Any]]]
     columns: rx.Var[list[dict[str, Any]]]
+    # Column-oriented alternative to ``rows``: ``{field: [values...]}``, as
+    # returned by ``lazyframe_to_datagrid_columnar``.  A column may also be
+    # dictionary-encoded as ``{"values": [...], "codes": [...]}``.  Takes
+    # precedence over ``rows`` when set.
+    column_data: rx.Var[dict[str, Any]]
 
     # ---- display ----
     loading: rx.Var[bool]
@@ -1284,6 +1328,14 @@ class DataGrid(rx.Component):
 # ---------------------------------------------------------------------------
 
 
+# Shared by every ``create()`` call; Reflex only reads it into a Var.
+_DEFAULT_AUTOSIZE_OPTIONS: dict[str, bool] = {
+    "includeHeaders": True,
+    "includeOutliers": True,
+    "expand": True,
+}
+
+
 class WrappedDataGrid(DataGrid):
     """DataGrid wrapped in a ``<div>`` with explicit width / height.
 
@@ -1312,14 +1364,7 @@ class WrappedDataGrid(DataGrid):
         props.setdefault("hide_footer", False)
         props.setdefault("always_show_filter_icon", True)
         props.setdefault("autosize_on_mount", True)
-        props.setdefault(
-            "autosize_options",
-            {
-                "includeHeaders": True,
-                "includeOutliers": True,
-                "expand": True,
-            },
-        )
+        props.setdefault("autosize_options", _DEFAULT_AUTOSIZE_OPTIONS)
 
         # Position the filter/preferences panel below the headers so it
         # does not obscure column titles.
@@ -30,6 +30,7 @@ Typical usage::
         return rx.cond(MyState.lf_grid_loaded, lazyframe_grid(MyState))
 """
 
+import functools
 import json
 import time
 from pathlib import Path
@@ -40,7 +41,7 @@ import reflex as rx
 
 from reflex_mui_datagrid.datagrid import data_grid
 from reflex_mui_datagrid.polars_utils import (
-    _dataframe_to_dicts,
+    _dataframe_to_columns,
     _resolve_field_name,
     apply_filter_model,
     apply_sort_model,
@@ -69,7 +70,15 @@ class _LazyFrameCache:
         self.lf: pl.LazyFrame | None = None
         self.schema: pl.Schema | None = None
         self.descriptions: dict[str, str] = {}
+        # ``(field, "  (description)")`` pairs in schema order, built once
+        # per LazyFrame for the row-click summary.
+        self.field_suffixes: list[tuple[str, str]] = []
+        # The same summary as one ``str.format_map`` template, or None when
+        # a field name is not usable as a format key.
+        self.summary_template: str | None = None
         self.col_defs: list[dict[str, Any]] = []
+        # Columns sent to the grid; None sends every column.
+        self.grid_columns: list[str] | None = None
         self.total_rows: int = 0
         self.value_options_max_unique: int = _DEFAULT_VALUE_OPTIONS_MAX_UNIQUE
         # Lazily computed per-column value options.
@@ -87,11 +96,69 @@ def _get_cache(cache_id: str) -> _LazyFrameCache:
     return _cache_registry[cache_id]
 
 
+@functools.lru_cache(maxsize=64)
+def _schema_col_defs(
+    schema_items: tuple[tuple[str, pl.DataType], ...],
+    description_items: tuple[tuple[str, str], ...],
+) -> tuple[dict[str, Any], ...]:
+    """Serialized column defs for a schema, memoized across loads.
+
+    Reloading the same file (or another session loading it) reuses the
+    dicts instead of rebuilding and re-serializing every ``ColumnDef``.
+    Callers must replace entries rather than mutate them.
+    """
+    col_defs = build_column_defs_from_schema(
+        pl.Schema(schema_items),
+        column_descriptions=dict(description_items),
+    )
+    return tuple(c.dict() for c in col_defs)
+
+
+def _field_suffixes(
+    fields: list[str], descriptions: dict[str, str]
+) -> list[tuple[str, str]]:
+    """Pair each field with the description suffix shown on row click."""
+    return [
+        (field, f"  ({descriptions[field]})" if descriptions.get(field) else "")
+        for field in fields
+        if field != "__row_id__"
+    ]
+
+
+def _summary_template(field_suffixes: list[tuple[str, str]]) -> str | None:
+    """Build a ``str.format_map`` template for the row-click summary.
+
+    Returns None if a field name would be misread as format syntax
+    (attribute/index access, conversions, positional indexes).
+    """
+    for field, _ in field_suffixes:
+        if not field or field.isdigit() or any(c in field for c in ".[]{}:!"):
+            return None
+    return "\n".join(
+        f"{field}: {{{field}}}" + suffix.replace("{", "{{").replace("}", "}}")
+        for field, suffix in field_suffixes
+    )
+
+
 # ---------------------------------------------------------------------------
 # File scanner
 # ---------------------------------------------------------------------------
 
 
+# Longest first line read when sniffing whether a ``.json`` file is NDJSON.
+_NDJSON_SNIFF_BYTES: int = 1 << 20
+
+
+def _looks_like_ndjson(path: Path) -> bool:
+    """Return True if the first line of *path* is a complete JSON object."""
+    with path.open("rb") as f:
+        first_line = f.readline(_NDJSON_SNIFF_BYTES)
+    try:
+        return isinstance(json.loads(first_line), dict)
+    except ValueError:
+        return False
+
+
 def scan_file(path: Path) -> tuple[pl.LazyFrame, dict[str, str]]:
     """Scan a data file and return a ``(LazyFrame, descriptions)`` tuple.
 
@@ -102,7 +169,9 @@ def scan_file(path: Path) -> tuple[pl.LazyFrame, dict[str, str]]:
     * ``.parquet`` / ``.pq`` -- uses ``pl.scan_parquet()``.
     * ``.csv`` -- uses ``pl.scan_csv()``.
     * ``.tsv`` -- uses ``pl.scan_csv(separator="\\t")``.
-    * ``.json`` -- uses ``pl.read_json().lazy()`` (no streaming scan).
+    * ``.json`` -- uses ``pl.scan_ndjson()`` when the file holds one
+      object per line, otherwise ``pl.read_json().lazy()`` (no streaming
+      scan for a JSON array).
     * ``.ndjson`` / ``.jsonl`` -- uses ``pl.scan_ndjson()``.
     * ``.ipc`` / ``.arrow`` / ``.feather`` -- uses ``pl.scan_ipc()``.
 
@@ -154,8 +223,11 @@ def scan_file(path: Path) -> tuple[pl.LazyFrame, dict[str, str]]:
     if suffix == ".tsv":
         return pl.scan_csv(path, separator="\t"), descriptions
 
-    # JSON (no streaming scan -- read then convert to lazy)
+    # JSON -- newline-delimited files are scanned lazily; a JSON array has
+    # no streaming scan, so it is read then converted to lazy.
     if suffix == ".json":
+        if _looks_like_ndjson(path):
+            return pl.scan_ndjson(path), descriptions
         return pl.read_json(path).lazy(), descriptions
 
     # NDJSON / JSONL
@@ -197,7 +269,7 @@ def _infer_value_options_for_column(
     cap = max_unique + 1
     result = lf.select(
         pl.col(col_name).cast(pl.String).drop_nulls().unique().head(cap)
-    ).collect()
+    ).collect(engine="streaming")
     values = result[col_name].drop_nulls().to_list()
     if 0 < len(values) <= max_unique:
         return sorted(str(v) for v in values)
@@ -295,7 +367,9 @@ class LazyFrameGridMixin(rx.State, mixin=True):
     """
 
     # -- Frontend state vars --
-    lf_grid_rows: list[dict[str, Any]] = []
+    # Loaded rows, column-oriented ({field: [values...]}); the grid
+    # rebuilds row objects in the browser.
+    lf_grid_column_data: dict[str, list[Any]] = {}
     lf_grid_columns: list[dict[str, Any]] = []
     lf_grid_row_count: int = 0
     lf_grid_loading: bool = False
@@ -317,6 +391,10 @@ class LazyFrameGridMixin(rx.State, mixin=True):
     _lf_grid_filter: dict[str, Any] = {}
     _lf_grid_sort: list[dict[str, Any]] = []
     _lf_grid_cache_id: str = ""
+    _lf_grid_loaded_rows: int = 0
+    # Columns left out by ``grid_columns`` for the loaded rows, plus their
+    # ``__row_id__``, so a row click can show the full row without a query.
+    _lf_grid_hidden_column_data: dict[str, list[Any]] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -330,12 +408,14 @@ class LazyFrameGridMixin(rx.State, mixin=True):
         value_options_max_unique: int = _DEFAULT_VALUE_OPTIONS_MAX_UNIQUE,
         eager_value_options_row_limit: int = _DEFAULT_EAGER_VALUE_OPTIONS_ROW_LIMIT,
         column_overrides: dict[str, dict[str, Any]] | None = None,
+        grid_columns: list[str] | None = None,
     ):
         """Prepare a LazyFrame for server-side browsing.
 
         This is a **generator** -- use ``yield from self.set_lazyframe(...)``
         inside your event handler so the loading state is sent to the
-        frontend immediately.
+        frontend immediately, and the first page is shown before any
+        eager value options are computed.
 
         The LazyFrame is stored in a module-level cache (never serialised
         into Reflex state).  Only the schema and first page slice are
@@ -370,6 +450,11 @@ class LazyFrameGridMixin(rx.State, mixin=True):
                 ``cellRendererConfig``, ``hide``).  Overrides are applied
                 before storing in the cache, so they survive all internal
                 operations (value options computation, filter upgrades).
+            grid_columns: Optional list of columns to show in the grid.
+                Only these are sent to the browser per chunk; the other
+                columns of the loaded rows stay on the backend, so the
+                row-click summary still lists every column.  Useful for
+                wide files such as VCFs with many INFO fields.
         """
         self.lf_grid_loading = True  # type: ignore[assignment]
         self.lf_grid_selected_info = "Preparing LazyFrame..."  # type: ignore[assignment]
@@ -387,13 +472,27 @@ class LazyFrameGridMixin(rx.State, mixin=True):
 
         # Schema is cheap -- metadata only, no data scan.
         cache.schema = lf.collect_schema()
+        cache.field_suffixes = _field_suffixes(
+            cache.schema.names(), cache.descriptions
+        )
+        cache.summary_template = _summary_template(cache.field_suffixes)
+        cache.grid_columns = (
+            [c for c in grid_columns if c in cache.schema]
+            if grid_columns is not None
+            else None
+        )
 
         # Build column defs from schema alone (no data scan).
-        col_defs = build_column_defs_from_schema(
-            cache.schema,
-            column_descriptions=cache.descriptions,
+        cache.col_defs = list(
+            _schema_col_defs(
+                tuple(cache.schema.items()), tuple(cache.descriptions.items())
+            )
         )
-        cache.col_defs = [c.dict() for c in col_defs]
+
+        if cache.grid_columns is not None:
+            cache.col_defs = [
+                col for col in cache.col_defs if col["field"] in cache.grid_columns
+            ]
 
         if column_overrides:
             for i, col in enumerate(cache.col_defs):
@@ -420,6 +519,12 @@ class LazyFrameGridMixin(rx.State, mixin=True):
             eager_value_options_row_limit > 0
             and self.lf_grid_row_count <= eager_value_options_row_limit
         ):
+            # Show the first page before scanning every string column.
+            self.lf_grid_loading = False  # type: ignore[assignment]
+            self.lf_grid_selected_info = (  # type: ignore[assignment]
+                f"{self.lf_grid_row_count:,} rows. Computing filter options..."
+            )
+            yield
             self._compute_all_value_options()
 
         self.lf_grid_loading = False  # type: ignore[assignment]
@@ -495,14 +600,22 @@ class LazyFrameGridMixin(rx.State, mixin=True):
         self._update_filter_debug()
         self.lf_grid_loading = False  # type: ignore[assignment]
 
-    def handle_lf_grid_scroll_end(self, _params: dict[str, Any]):
+    def handle_lf_grid_scroll_end(self, params: dict[str, Any]):
         """Load the next chunk when the virtual scroller nears the bottom.
 
         This is a generator so the loading/stats state is pushed to the
         frontend *before* the Polars query runs.
+
+        Scroll-end events are coalesced: one fired while the grid held
+        fewer rows than it does now (``loadedRows``) was queued behind a
+        chunk that has since arrived, so it is dropped instead of
+        fetching a chunk the user never scrolled to.
         """
         if self.lf_grid_loading:
             return
+        loaded_rows = params.get("loadedRows")
+        if loaded_rows is not None and loaded_rows != self._lf_grid_loaded_rows:
+            return
 
         page = self.lf_grid_pagination_model.get("page", 0)
         page_size = self.lf_grid_pagination_model.get("pageSize", _DEFAULT_CHUNK_SIZE)
@@ -518,7 +631,7 @@ class LazyFrameGridMixin(rx.State, mixin=True):
         self.lf_grid_pagination_model = {"page": page + 1, "pageSize": page_size}  # type: ignore[assignment]
         self._refresh_lf_grid_page(append=True, refresh_row_count=False)
         elapsed_ms = (time.perf_counter() - t0) * 1000
-        total_rows = len(self.lf_grid_rows)
+        total_rows = self._lf_grid_loaded_rows
         self.lf_grid_loading = False  # type: ignore[assignment]
         print(
             f"[LazyFrameGrid] scroll-end chunk: "
@@ -560,24 +673,58 @@ class LazyFrameGridMixin(rx.State, mixin=True):
                     break
 
     def handle_lf_grid_row_click(self, params: dict[str, Any]) -> None:
-        """Handle row click -- show all fields with descriptions."""
+        """Handle row click -- show all fields with descriptions.
+
+        When ``grid_columns`` limits what the browser holds, the other
+        fields are taken from the loaded rows kept server-side, found by
+        the row's ``__row_id__``.
+        """
         row: dict[str, Any] = params.get("row", {})
         if not row:
             return
 
         cache_id = self._lf_grid_cache_id
-        descs = _get_cache(cache_id).descriptions if cache_id else {}
+        if not cache_id:
+            self.lf_grid_selected_info = "\n".join(  # type: ignore[assignment]
+                f"{field}: {value}"
+                for field, value in row.items()
+                if field != "__row_id__"
+            )
+            return
+        cache = _get_cache(cache_id)
+        hidden = self._lf_grid_hidden_column_data
+        row_ids = hidden.get("__row_id__", [])
+        row_id = row.get("__row_id__")
+        if row_ids and isinstance(row_id, int):
+            # Loaded rows are contiguous, so the id maps to a position.
+            index = row_id - row_ids[0]
+            if 0 <= index < len(row_ids) and row_ids[index] == row_id:
+                row = {
+                    **row,
+                    **{field: values[index] for field, values in hidden.items()},
+                }
+
+        # The browser may hand back keys in a different case (``DP`` ->
+        # ``dp``); map them onto the schema names the summary is keyed by.
+        if cache.schema is not None:
+            row = {
+                (_resolve_field_name(key, cache.schema) or key): value
+                for key, value in row.items()
+            }
 
-        lines: list[str] = []
-        for field, value in row.items():
-            if field == "__row_id__":
-                continue
-            desc = descs.get(field, "")
-            if desc:
-                lines.append(f"{field}: {value}  ({desc})")
-            else:
-                lines.append(f"{field}: {value}")
-        self.lf_grid_selected_info = "\n".join(lines)  # type: ignore[assignment]
+        if cache.summary_template is not None:
+            try:
+                self.lf_grid_selected_info = (  # type: ignore[assignment]
+                    cache.summary_template.format_map(row)
+                )
+                return
+            except KeyError:
+                pass  # row lacks some fields -- list only those it has
+        self.lf_grid_selected_info = "\n".join(  # type: ignore[assignment]
+            f"{field}: {row[field]}{suffix}"
+            for field, suffix in cache.field_suffixes
+            if field in row
+        )
 
     def handle_lf_grid_row_selection(self, selection_model: dict[str, Any]) -> None:
         """Handle row selection change from the grid."""
@@ -861,6 +1008,17 @@ class LazyFrameGridMixin(rx.State, mixin=True):
             f"{n_computed} columns with dropdowns ({elapsed_ms:.1f}ms)"
         )
 
+    def _lf_grid_view(
+        self, cache: _LazyFrameCache, *, sort: bool = True
+    ) -> pl.LazyFrame:
+        """Return the cached LazyFrame with the current filter (and sort) applied."""
+        lf: pl.LazyFrame = cache.lf  # type: ignore[assignment]
+        if self._lf_grid_filter and self._lf_grid_filter.get("items"):
+            lf = apply_filter_model(lf, self._lf_grid_filter, cache.schema)
+        if sort and self._lf_grid_sort:
+            lf = apply_sort_model(lf, self._lf_grid_sort, cache.schema)
+        return lf
+
     def _refresh_lf_grid_page(
         self,
         *,
@@ -880,20 +1038,20 @@ class LazyFrameGridMixin(rx.State, mixin=True):
             return
 
         t0 = time.perf_counter()
-        lf: pl.LazyFrame = cache.lf
 
         # Apply filter.
-        if self._lf_grid_filter and self._lf_grid_filter.get("items"):
-            lf = apply_filter_model(lf, self._lf_grid_filter, cache.schema)
+        lf = self._lf_grid_view(cache, sort=False)
 
         # Count filtered rows when the stream is reset.
         # This is a lightweight query -- Polars pushes ``select(len())``
         # into the scan for formats that support it (Parquet, IPC).
         # For VCF/CSV it does require a scan, but only counts rows
-        # (no data materialisation).
+        # (no data materialisation), streamed in batches.
         if refresh_row_count:
             t_count = time.perf_counter()
-            self.lf_grid_row_count = lf.select(pl.len()).collect().item()  # type: ignore[assignment]
+            self.lf_grid_row_count = (  # type: ignore[assignment]
+                lf.select(pl.len()).collect(engine="streaming").item()
+            )
             cache.total_rows = self.lf_grid_row_count
             print(
                 f"[LazyFrameGrid] row count: {self.lf_grid_row_count:,} "
@@ -904,33 +1062,57 @@ class LazyFrameGridMixin(rx.State, mixin=True):
         if self._lf_grid_sort:
             lf = apply_sort_model(lf, self._lf_grid_sort, cache.schema)
 
-        # Slice to current page -- only this slice is collected.
+        # Slice to current page -- only this slice (and only the grid's
+        # columns) is collected.
         page = self.lf_grid_pagination_model.get("page", 0)
         page_size = self.lf_grid_pagination_model.get("pageSize", _DEFAULT_CHUNK_SIZE)
         offset = page * page_size
-        page_df: pl.DataFrame = lf.slice(offset, page_size).collect()
+        lf = lf.slice(offset, page_size)
+        page_df: pl.DataFrame = lf.collect()
 
         # Add stable row IDs (global index within the filtered+sorted result).
         page_df = page_df.with_row_index("__row_id__", offset=offset)
 
-        # Convert to JSON-safe dicts.
-        rows = _dataframe_to_dicts(page_df)
+        # Only the grid's columns go to the browser; the rest stay in a
+        # backend var for the row-click summary.
+        hidden_columns: dict[str, list[Any]] = {}
+        if cache.grid_columns is not None:
+            hidden_names = [
+                name for name in page_df.columns if name not in cache.grid_columns
+            ]
+            hidden_columns = _dataframe_to_columns(page_df.select(hidden_names))
+            page_df = page_df.select("__row_id__", *cache.grid_columns)
+
+        # Convert to JSON-safe columns; field names travel once per payload.
+        columns = _dataframe_to_columns(page_df)
         if append:
-            self.lf_grid_rows = self.lf_grid_rows + rows  # type: ignore[assignment]
+            loaded = self.lf_grid_column_data
+            columns = {
+                field: loaded.get(field, []) + values
+                for field, values in columns.items()
+            }
+            loaded_hidden = self._lf_grid_hidden_column_data
+            hidden_columns = {
+                field: loaded_hidden.get(field, []) + values
+                for field, values in hidden_columns.items()
+            }
+            self._lf_grid_loaded_rows += page_df.height  # type: ignore[operator]
         else:
-            self.lf_grid_rows = rows  # type: ignore[assignment]
+            self._lf_grid_loaded_rows = page_df.height  # type: ignore[assignment]
+        self.lf_grid_column_data = columns  # type: ignore[assignment]
+        self._lf_grid_hidden_column_data = hidden_columns  # type: ignore[assignment]
 
         elapsed_ms = (time.perf_counter() - t0) * 1000
-        total_loaded = len(self.lf_grid_rows)
+        total_loaded = self._lf_grid_loaded_rows
         mode = "append" if append else "replace"
         self.lf_grid_stats = (  # type: ignore[assignment]
-            f"offset={offset:,}  +{len(rows)} rows  "
+            f"offset={offset:,}  +{page_df.height} rows  "
             f"loaded={total_loaded:,} / {self.lf_grid_row_count:,}  "
             f"{elapsed_ms:.0f}ms  ({mode})"
         )
         print(
             f"[LazyFrameGrid] page refresh: offset={offset}, "
-            f"slice={len(rows)}, mode={mode}, "
+            f"slice={page_df.height}, mode={mode}, "
             f"elapsed={elapsed_ms:.1f}ms"
         )
 
@@ -1025,7 +1207,7 @@ def lazyframe_grid(
         detail_props["detail_badge_colors"] = detail_badge_colors
 
     grid = data_grid(
-        rows=state_cls.lf_grid_rows,
+        column_data=state_cls.lf_grid_column_data,
         columns=state_cls.lf_grid_columns,
         row_id_field="__row_id__",
         # -- Scroll-loading mode --
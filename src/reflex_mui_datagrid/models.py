@@ -1,11 +1,14 @@
 """Pydantic-style models for MUI X DataGrid column definitions and configuration."""
 
+import builtins
+import functools
 import typing
 import json
 from typing import Any, Literal
 
 import reflex as rx
 from reflex.components.props import PropsBase
+from reflex.utils import format
 
 
 class UrlCellRenderer(rx.Var):
@@ -179,6 +182,15 @@ class ProgressBarCellRenderer(rx.Var):
         pass
 
 
+_UNSET = object()
+
+
+@functools.cache
+def _camel_case_fields(cls: type[PropsBase]) -> tuple[tuple[str, str], ...]:
+    """Return ``(field_name, camelCaseKey)`` pairs for *cls*, computed once."""
+    return tuple((name, format.to_camel_case(name)) for name in cls.get_fields())
+
+
 class ColumnDef(PropsBase):
     """Column definition for the MUI X DataGrid, maps to GridColDef.
 
@@ -212,3 +224,28 @@ class ColumnDef(PropsBase):
     cell_renderer_type: Literal["badge", "progress_bar", "url"] | None = None
     cell_renderer_config: dict[str, Any] | None = None
     disable_column_menu: bool | rx.Var[bool] = False
+
+    def dict(
+        self,
+        exclude_none: bool = True,
+        include: set[str] | None = None,
+        exclude: set[str] | None = None,
+        **kwargs: Any,
+    ) -> builtins.dict[str, Any]:
+        """Convert to a camelCase dict, exactly like :meth:`PropsBase.dict`.
+
+        The camelCase keys are computed once per class rather than once
+        per field on every call, and only nested containers go through
+        the recursive conversion.
+        """
+        if include is not None or exclude is not None:
+            return super().dict(exclude_none, include, exclude, **kwargs)
+        result: builtins.dict[str, Any] = {}
+        for field_name, camel_key in _camel_case_fields(type(self)):
+            value = getattr(self, field_name, _UNSET)
+            if value is _UNSET or (exclude_none and value is None):
+                continue
+            if isinstance(value, (builtins.dict, list, tuple, PropsBase)):
+                value = self._convert_to_camel_case(value, exclude_none)
+            result[camel_key] = value
+        return result
@@ -15,7 +15,10 @@ import polars as pl
 import polars_bio as pb
 
 from reflex_mui_datagrid.models import ColumnDef
-from reflex_mui_datagrid.polars_utils import lazyframe_to_datagrid
+from reflex_mui_datagrid.polars_utils import (
+    lazyframe_to_datagrid,
+    lazyframe_to_datagrid_columnar,
+)
 
 # ---------------------------------------------------------------------------
 # Standard VCF column descriptions (defined by the VCF specification,
@@ -130,3 +133,37 @@ def bio_lazyframe_to_datagrid(
         single_select_threshold=single_select_threshold,
         column_descriptions=merged_descriptions,
     )
+
+
+def bio_lazyframe_to_datagrid_columnar(
+    lf: pl.LazyFrame,
+    *,
+    id_field: str | None = None,
+    show_id_field: bool = False,
+    limit: int | None = None,
+    single_select_threshold: int = 500,
+    column_descriptions: dict[str, str] | None = None,
+    dictionary_encode: bool = True,
+) -> tuple[dict[str, Any], list[ColumnDef]]:
+    """Column-oriented variant of :func:`bio_lazyframe_to_datagrid`.
+
+    Descriptions are merged the same way; the data is returned as for
+    :func:`lazyframe_to_datagrid_columnar` and goes to the ``column_data``
+    prop of ``data_grid()``.
+
+    Returns:
+        A ``(column_data, column_defs)`` tuple ready for the DataGrid component.
+    """
+    merged_descriptions = extract_vcf_descriptions(lf)
+    if column_descriptions is not None:
+        merged_descriptions.update(column_descriptions)
+
+    return lazyframe_to_datagrid_columnar(
+        lf,
+        id_field=id_field,
+        show_id_field=show_id_field,
+        limit=limit,
+        single_select_threshold=single_select_threshold,
+        column_descriptions=merged_descriptions,
+        dictionary_encode=dictionary_encode,
+    )
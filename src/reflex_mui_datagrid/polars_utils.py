@@ -68,8 +68,12 @@ def _col_to_str_expr(col: pl.Expr, dtype: pl.DataType) -> pl.Expr:
     * ``List(T)`` → cast inner to String, then ``list.join(",")``
     * ``Array(T, n)`` → cast to ``List(String)``, then ``list.join(",")``
     * ``Struct`` → ``cast(pl.String)`` (Polars supports this natively)
+    * ``String`` → returned unchanged, so the filter predicate is a plain
+      column comparison that scans can push down
     * Everything else → ``cast(pl.String)``
     """
+    if dtype == pl.String:
+        return col
     if isinstance(dtype, pl.List):
         return col.cast(pl.List(pl.String)).list.join(",")
     if isinstance(dtype, pl.Array):
@@ -117,46 +121,27 @@ def _detect_single_select(
     return None
 
 
-def lazyframe_to_datagrid(
+def _collect_for_datagrid(
     lf: pl.LazyFrame,
     *,
-    id_field: str | None = None,
-    show_id_field: bool = False,
-    limit: int | None = None,
-    single_select_threshold: int = 500,
-    column_descriptions: dict[str, str] | None = None,
-) -> tuple[list[dict[str, Any]], list[ColumnDef]]:
-    """Convert a polars LazyFrame into MUI DataGrid *rows* and *column_defs*.
-
-    Args:
-        lf: The polars LazyFrame to convert.
-        id_field: Name of the column that serves as the unique row identifier.
-            If ``None`` and no ``"id"`` column exists, a ``"__row_id__"``
-            column is added automatically with a zero-based row index.
-        show_id_field: Whether to include the row identifier as a visible column.
-        limit: Optional maximum number of rows to collect.
-        single_select_threshold: String columns with at most this many distinct
-            values are automatically turned into ``singleSelect`` columns with
-            a dropdown filter.  Set to ``0`` to disable auto-detection.
-            MUI renders dropdowns as scrollable/searchable lists, so several
-            hundred values are perfectly usable.
-        column_descriptions: Optional mapping of column names to human-readable
-            descriptions.  When provided, each matching column definition gets
-            its ``description`` field set, which MUI DataGrid renders as a
-            tooltip on the column header.  To show descriptions as subtitles
-            in the header (not just tooltips), pass
-            ``show_description_in_header=True`` to the ``data_grid()``
-            component.
-
-    Returns:
-        A ``(rows, column_defs)`` tuple where *rows* is a list of dicts
-        ready for the DataGrid ``rows`` prop, and *column_defs* is a list of
-        :class:`ColumnDef` instances inferred from the schema.
+    id_field: str | None,
+    show_id_field: bool,
+    limit: int | None,
+    single_select_threshold: int,
+    column_descriptions: dict[str, str] | None,
+) -> tuple[pl.DataFrame, list[ColumnDef]]:
+    """Collect *lf* (with a guaranteed row id) and infer its column defs.
+
+    Shared by :func:`lazyframe_to_datagrid` and
+    :func:`lazyframe_to_datagrid_columnar`, which only differ in how the
+    collected frame is serialised.
     """
     if limit is not None:
         lf = lf.head(limit)
 
-    df = lf.collect()
+    # The streaming engine processes the scan in batches, so peak memory
+    # stays near the size of the result rather than of every intermediate.
+    df = lf.collect(engine="streaming")
 
     # Ensure every row has an id MUI DataGrid can use.
     # If the caller specified an id_field, trust it.  Otherwise check
@@ -172,10 +157,6 @@ def lazyframe_to_datagrid(
             df = df.with_row_index("__row_id__")
             effective_id_field = "__row_id__"
 
-    # Build rows – serialise to Python dicts.
-    # Dates/datetimes must be converted to ISO strings for JSON transport.
-    rows: list[dict[str, Any]] = _dataframe_to_dicts(df)
-
     # Build column definitions from the schema.
     column_defs: list[ColumnDef] = []
     for col_name in df.columns:
@@ -214,7 +195,104 @@ def lazyframe_to_datagrid(
         )
         column_defs.append(col_def)
 
-    return rows, column_defs
+    return df, column_defs
+
+
+def lazyframe_to_datagrid(
+    lf: pl.LazyFrame,
+    *,
+    id_field: str | None = None,
+    show_id_field: bool = False,
+    limit: int | None = None,
+    single_select_threshold: int = 500,
+    column_descriptions: dict[str, str] | None = None,
+) -> tuple[list[dict[str, Any]], list[ColumnDef]]:
+    """Convert a polars LazyFrame into MUI DataGrid *rows* and *column_defs*.
+
+    Args:
+        lf: The polars LazyFrame to convert.
+        id_field: Name of the column that serves as the unique row identifier.
+            If ``None`` and no ``"id"`` column exists, a ``"__row_id__"``
+            column is added automatically with a zero-based row index.
+        show_id_field: Whether to include the row identifier as a visible column.
+        limit: Optional maximum number of rows to collect.
+        single_select_threshold: String columns with at most this many distinct
+            values are automatically turned into ``singleSelect`` columns with
+            a dropdown filter.  Set to ``0`` to disable auto-detection.
+            MUI renders dropdowns as scrollable/searchable lists, so several
+            hundred values are perfectly usable.
+        column_descriptions: Optional mapping of column names to human-readable
+            descriptions.  When provided, each matching column definition gets
+            its ``description`` field set, which MUI DataGrid renders as a
+            tooltip on the column header.  To show descriptions as subtitles
+            in the header (not just tooltips), pass
+            ``show_description_in_header=True`` to the ``data_grid()``
+            component.
+
+    Returns:
+        A ``(rows, column_defs)`` tuple where *rows* is a list of dicts
+        ready for the DataGrid ``rows`` prop, and *column_defs* is a list of
+        :class:`ColumnDef` instances inferred from the schema.
+    """
+    df, column_defs = _collect_for_datagrid(
+        lf,
+        id_field=id_field,
+        show_id_field=show_id_field,
+        limit=limit,
+        single_select_threshold=single_select_threshold,
+        column_descriptions=column_descriptions,
+    )
+    # Dates/datetimes must be converted to ISO strings for JSON transport.
+    return _dataframe_to_dicts(df), column_defs
+
+
+def lazyframe_to_datagrid_columnar(
+    lf: pl.LazyFrame,
+    *,
+    id_field: str | None = None,
+    show_id_field: bool = False,
+    limit: int | None = None,
+    single_select_threshold: int = 500,
+    column_descriptions: dict[str, str] | None = None,
+    dictionary_encode: bool = True,
+) -> tuple[dict[str, Any], list[ColumnDef]]:
+    """Like :func:`lazyframe_to_datagrid`, but return the data column-oriented.
+
+    Instead of one dict per row, the data is a ``{column: [values...]}``
+    mapping (struct-of-arrays).  Pass it to the ``column_data`` prop of
+    ``data_grid()``; the browser rebuilds row objects once per payload.
+    Each column name is sent once rather than once per row, which keeps
+    both the state held on the server and every state-sync message
+    considerably smaller for wide or long tables.
+
+    Low-cardinality string columns are dictionary-encoded as
+    ``{"values": [distinct...], "codes": [index or None, ...]}`` so each
+    repeated string is sent once; ``data_grid()`` decodes them.
+
+    Args:
+        lf: The polars LazyFrame to convert.
+        id_field: See :func:`lazyframe_to_datagrid`.
+        show_id_field: See :func:`lazyframe_to_datagrid`.
+        limit: See :func:`lazyframe_to_datagrid`.
+        single_select_threshold: See :func:`lazyframe_to_datagrid`.
+        column_descriptions: See :func:`lazyframe_to_datagrid`.
+        dictionary_encode: Dictionary-encode string columns with at most
+            half as many distinct values as rows.  Set to ``False`` to
+            always send plain value lists.
+
+    Returns:
+        A ``(column_data, column_defs)`` tuple where *column_data* maps each
+        column (including the row id) to its JSON-safe values.
+    """
+    df, column_defs = _collect_for_datagrid(
+        lf,
+        id_field=id_field,
+        show_id_field=show_id_field,
+        limit=limit,
+        single_select_threshold=single_select_threshold,
+        column_descriptions=column_descriptions,
+    )
+    return _dataframe_to_columns(df, dictionary_encode=dictionary_encode), column_defs
 
 
 def build_column_defs_from_schema(
@@ -535,8 +613,8 @@ def apply_sort_model(
 ) -> pl.LazyFrame:
     """Apply a MUI DataGrid sort model to a Polars LazyFrame.
 
-    Translates the MUI ``sortModel`` array into a ``lf.sort()`` call and
-    returns the sorted LazyFrame — **no collect**.
+    Translates the MUI ``sortModel`` array into a stable ``lf.sort()``
+    call and returns the sorted LazyFrame — **no collect**.
 
     Field names are resolved case-insensitively against the schema to
     handle any case mismatches from the frontend serialisation layer.
@@ -580,19 +658,22 @@ def apply_sort_model(
     if not by:
         return lf
 
-    return lf.sort(by=by, descending=descending)
+    # Stable, so rows with tied sort keys keep their order across queries:
+    # a row's position in the sorted view (``__row_id__``) stays the same
+    # for every page slice and for the row-click lookup.
+    return lf.sort(by=by, descending=descending, maintain_order=True)
 
 
-def _dataframe_to_dicts(df: pl.DataFrame) -> list[dict[str, Any]]:
-    """Convert a DataFrame to a list of JSON-safe dicts.
+def _json_safe_frame(df: pl.DataFrame) -> pl.DataFrame:
+    """Cast the columns of *df* that JSON cannot carry natively.
 
-    Non-JSON-safe column types are converted automatically:
     * Temporal columns (Date, Datetime, Time, Duration) -> ISO-8601 strings.
     * List columns -> comma-joined strings (inner values cast to String first).
     * Struct columns -> cast to String.
 
-    Other types are left as-is (polars ``to_dicts()`` already returns
-    Python-native scalars for numeric / string / bool).
+    Other types are left as-is (polars already returns Python-native
+    scalars for numeric / string / bool).  *df* is returned unchanged when
+    no column needs a cast.
     """
     temporal_cols: set[str] = set()
     list_cols: set[str] = set()
@@ -608,7 +689,7 @@ def _dataframe_to_dicts(df: pl.DataFrame) -> list[dict[str, Any]]:
 
     needs_cast = temporal_cols | list_cols | struct_cols
     if not needs_cast:
-        return df.to_dicts()
+        return df
 
     # Build select expressions that preserve original column order,
     # casting non-JSON-safe columns to String for safe serialisation.
@@ -623,7 +704,40 @@ def _dataframe_to_dicts(df: pl.DataFrame) -> list[dict[str, Any]]:
         else:
             exprs.append(pl.col(c))
 
-    return df.select(exprs).to_dicts()
+    return df.select(exprs)
+
+
+def _dataframe_to_dicts(df: pl.DataFrame) -> list[dict[str, Any]]:
+    """Convert a DataFrame to a list of JSON-safe dicts (one per row)."""
+    return _json_safe_frame(df).to_dicts()
+
+
+def _dataframe_to_columns(
+    df: pl.DataFrame, *, dictionary_encode: bool = False
+) -> dict[str, Any]:
+    """Convert a DataFrame to a JSON-safe ``{column: [values...]}`` mapping.
+
+    With *dictionary_encode*, string-like columns whose distinct values
+    number at most half the rows become ``{"values": [...], "codes": [...]}``.
+    """
+    df = _json_safe_frame(df)
+    if not dictionary_encode:
+        return df.to_dict(as_series=False)
+
+    columns: dict[str, Any] = {}
+    for series in df.get_columns():
+        if series.dtype == pl.String or _is_categorical_dtype(series.dtype):
+            strings = series.cast(pl.String)
+            values = strings.drop_nulls().unique(maintain_order=True)
+            if strings.len() and values.len() * 2 <= strings.len():
+                codes = strings.cast(pl.Enum(values)).to_physical()
+                columns[series.name] = {
+                    "values": values.to_list(),
+                    "codes": codes.to_list(),
+                }
+                continue
+        columns[series.name] = series.to_list()
+    return columns
 
 
 # ---------------------------------------------------------------------------